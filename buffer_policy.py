@@ -0,0 +1,71 @@
+#!/usr/bin/python3
+"""Policies deciding when decrease-key flushes the decrease buffer
+of smooth heap and slim heap (the buffer is always flushed upon delete-min)"""
+
+
+class BufferPolicy:
+    """interface implemented by all buffer policies"""
+
+    def should_flush(self, heap, count=1):
+        """called by decrease-key after a node (by decrease_keys after count nodes) was placed in buffer;
+        returns True iff buffer of heap is to be consolidated now"""
+        pass
+
+    def delete_min(self, heap):
+        """called at the start of every delete-min"""
+        pass
+
+
+class LogSizePolicy(BufferPolicy):
+    """flushes buffer once it holds more than ceil(log2(size)) nodes (default)"""
+
+    def should_flush(self, heap, count=1):
+        return len(heap.buffer) > (heap.size - 1).bit_length()  # integer ceil(log2(size))
+
+
+class FixedSizePolicy(BufferPolicy):
+    """flushes buffer once it holds more than limit nodes"""
+
+    def __init__(self, limit):
+        self.limit = limit
+
+    def should_flush(self, heap, count=1):
+        return len(heap.buffer) > self.limit
+
+
+class FractionPolicy(BufferPolicy):
+    """flushes buffer once it holds more than the given fraction of all nodes in heap"""
+
+    def __init__(self, fraction):
+        self.fraction = fraction
+
+    def should_flush(self, heap, count=1):
+        return len(heap.buffer) > self.fraction * heap.size
+
+
+class DeleteMinPolicy(BufferPolicy):
+    """never flushes buffer in decrease-key, only upon delete-min"""
+
+    def should_flush(self, heap, count=1):
+        return False
+
+
+class AdaptivePolicy(BufferPolicy):
+    """lets buffer grow up to the number of decrease-keys expected before the next delete-min,
+    estimated as exponential moving average over previous delete-mins;
+    buffer size is at least ceil(log2(size)) and at most maxFraction of all nodes in heap"""
+
+    def __init__(self, smoothing=0.125, maxFraction=0.5):
+        self.smoothing = smoothing  # weight of most recent delete-min in average
+        self.maxFraction = maxFraction
+        self.ratio = 0.0  # average number of decrease-keys per delete-min
+        self.pending = 0  # decrease-keys since last delete-min
+
+    def should_flush(self, heap, count=1):
+        self.pending += count
+        limit = max((heap.size - 1).bit_length(), min(self.ratio, self.maxFraction * heap.size))
+        return len(heap.buffer) > limit
+
+    def delete_min(self, heap):
+        self.ratio += self.smoothing * (self.pending - self.ratio)
+        self.pending = 0
@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+"""Uninstrumented builds of the heap variants, generated from the same source:
+the class body is recompiled without the statements maintaining pointer update,
+link and comparison counters, so the structure of the heap evolves identically"""
+import ast
+import inspect
+import sys
+
+COUNTER_ATTRIBUTES = {"updates", "comps", "links"}  # counters kept on the heap or its stats, e.g. self.stats.updates
+COUNTER_NAMES = {"compCount", "linkCount", "comps", "links"}  # counters kept in local variables
+
+_builds = {}
+
+
+def is_counter(node):
+    return (isinstance(node, ast.Attribute) and node.attr in COUNTER_ATTRIBUTES) or \
+           (isinstance(node, ast.Name) and node.id in COUNTER_NAMES)
+
+
+class StripCounters(ast.NodeTransformer):
+    """removes augmented assignments to counters (right-hand sides with calls are kept as expressions)
+    and assertions checking counters"""
+
+    def visit_AugAssign(self, node):
+        if is_counter(node.target):
+            if any(isinstance(child, ast.Call) for child in ast.walk(node.value)):
+                return ast.copy_location(ast.Expr(value=node.value), node)
+            return None
+        return node
+
+    def visit_Assert(self, node):
+        if any(is_counter(child) for child in ast.walk(node.test)):
+            return None
+        return node
+
+    def generic_visit(self, node):
+        super().generic_visit(node)
+        if getattr(node, "body", None) == []:  # block left empty by removed statements
+            node.body.append(ast.copy_location(ast.Pass(), node))
+        return node
+
+
+def uninstrumented(heapClass):
+    """returns class behaving like heapClass without counting pointer updates, links and comparisons;
+    its operations return results of the same shape, but the counts in them are not meaningful"""
+    if heapClass not in _builds:
+        module = sys.modules[heapClass.__module__]
+        source, firstLine = inspect.getsourcelines(heapClass)
+        tree = ast.parse("".join(source))
+        ast.increment_lineno(tree, firstLine - 1)  # tracebacks point into the original file
+        tree = ast.fix_missing_locations(StripCounters().visit(tree))
+        namespace = dict(vars(module))  # class name is rebound, so temporary heaps are uninstrumented too
+        exec(compile(tree, inspect.getsourcefile(heapClass), "exec"), namespace)
+        fastClass = namespace[heapClass.__name__]
+        fastClass.__qualname__ = heapClass.__name__ + "Fast"
+        _builds[heapClass] = fastClass
+    return _builds[heapClass]
@@ -0,0 +1,61 @@
+#!/usr/bin/python3
+"""Binary heap of candidate roots, from which batch extraction peels minima off a consolidated heap"""
+
+
+class Frontier:
+    """binary min-heap of nodes ordered by key, counting its comparisons in comps"""
+
+    def __init__(self, nodes):
+        self.nodes = list(nodes)
+        self.comps = 0
+        for i in range(len(self.nodes) // 2 - 1, -1, -1):
+            self.sift_down(i)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def min(self):
+        return self.nodes[0] if len(self.nodes) > 0 else None
+
+    def push(self, node):
+        self.nodes.append(node)
+        self.sift_up(len(self.nodes) - 1)
+
+    def pop(self):
+        """removes and returns node with minimum key"""
+        nodes = self.nodes
+        top = nodes[0]
+        last = nodes.pop()
+        if len(nodes) > 0:
+            nodes[0] = last
+            self.sift_down(0)
+        return top
+
+    def sift_up(self, i):
+        nodes = self.nodes
+        node = nodes[i]
+        while i > 0:
+            parent = (i - 1) // 2
+            self.comps += 1
+            if nodes[parent].key <= node.key:
+                break
+            nodes[i] = nodes[parent]
+            i = parent
+        nodes[i] = node
+
+    def sift_down(self, i):
+        nodes = self.nodes
+        n = len(nodes)
+        node = nodes[i]
+        while 2 * i + 1 < n:
+            child = 2 * i + 1
+            if child + 1 < n:
+                self.comps += 1
+                if nodes[child + 1].key < nodes[child].key:
+                    child += 1
+            self.comps += 1
+            if node.key <= nodes[child].key:
+                break
+            nodes[i] = nodes[child]
+            i = child
+        nodes[i] = node
@@ -0,0 +1,20 @@
+#!/usr/bin/python3
+"""Keeping the cyclic garbage collector away from large heaps"""
+import gc
+from contextlib import contextmanager
+
+
+@contextmanager
+def gc_paused(freeze=False):
+    """disables cyclic garbage collection within block, e.g. during bulk construction of a heap;
+    with freeze set, all objects alive at the end of the block are moved to the permanent generation,
+    so later collections do not traverse them (undo with gc.unfreeze())"""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if freeze:
+            gc.freeze()
+        if enabled:
+            gc.enable()
@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+"""Instrumentation shared by a heap and the temporary heaps created within its operations"""
+
+COUNTERS = ("updates", "links", "comps", "inserts", "deleteMins", "peels", "merges", "decreaseKeys", "increaseKeys",
+            "deletes")
+
+
+class HeapStats:
+    """counters of pointer updates (kept by the heap itself), links and comparisons,
+    and number of operations of each type (kept by PairingHeap);
+    minima peeled off by batch extraction without consolidating are counted in peels, not in deleteMins"""
+    __slots__ = COUNTERS
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """sets all counters to zero"""
+        for name in COUNTERS:
+            setattr(self, name, 0)
+
+    def snapshot(self):
+        """returns copy of current counters, e.g. to subtract it from later counters"""
+        copy = HeapStats()
+        for name in COUNTERS:
+            setattr(copy, name, getattr(self, name))
+        return copy
+
+    def absorb(self, other):
+        """adds counters of other (e.g. of a heap merged into this one) to this object and resets other"""
+        if other is self:
+            return
+        for name in COUNTERS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        other.reset()
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in COUNTERS}
+
+    def __sub__(self, other):
+        """counters accumulated since snapshot other"""
+        difference = HeapStats()
+        for name in COUNTERS:
+            setattr(difference, name, getattr(self, name) - getattr(other, name))
+        return difference
+
+    def __repr__(self):
+        return "HeapStats({})".format(", ".join("{}={}".format(name, getattr(self, name)) for name in COUNTERS))
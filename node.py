@@ -1,5 +1,10 @@
 #!/usr/bin/python3
-"""Base object for construction of all heap variants"""
+"""Base object for construction of all heap variants,
+and compact node types holding only the pointers of one heap family"""
+
+IN_FOREST = "forest"  # node is a top-level root in root list of heap
+IN_BUFFER = "buffer"  # node is a top-level root in decrease buffer of heap
+IN_MAIN = "main"  # node is a top-level root among the orphaned children of the last deleted min (PairingHeapL)
 
 class Node:
 	def __init__(self, key):
@@ -14,6 +19,65 @@ class Node:
 		self.leftOnly = False
 		self.rightOnly = False
 		self.min = 1000000000  # min key in subtree
+		self.prevRoot = None  # neighbours in intrusive root list
+		self.nextRoot = None
+		self.location = None  # IN_FOREST, IN_BUFFER or IN_MAIN for top-level roots, None otherwise
 		
 		self.vertex = None  # used for testing with Dijkstra's algorithm
 
+
+
+class PairingNode:
+	"""node of pairing heap variants (modes 0, 21, 25, 29-33)"""
+	__slots__ = ("key", "parent", "leftChild", "nextSibling", "prevSibling", "prevRoot", "nextRoot", "location", "vertex")
+
+	def __init__(self, key):
+		self.key = key
+		self.parent = None
+		self.leftChild = None
+		self.nextSibling = None
+		self.prevSibling = None
+		self.prevRoot = None
+		self.nextRoot = None
+		self.location = None
+		self.vertex = None
+
+
+class SmoothNode:
+	"""node of smooth heap and slim heap variants (modes 12, 22, 23, 24, 27, 28)"""
+	__slots__ = ("key", "parent", "rightChild", "nextSibling", "prevSibling", "prevRoot", "nextRoot", "location", "vertex")
+
+	def __init__(self, key):
+		self.key = key
+		self.parent = None
+		self.rightChild = None
+		self.nextSibling = None
+		self.prevSibling = None
+		self.prevRoot = None
+		self.nextRoot = None
+		self.location = None
+		self.vertex = None
+
+
+class SplayNode:
+	"""node of splay tree (mode 26)"""
+	__slots__ = ("key", "parent", "leftChild", "rightChild", "min", "vertex")
+
+	def __init__(self, key):
+		self.key = key
+		self.parent = None
+		self.leftChild = None
+		self.rightChild = None
+		self.min = 1000000000  # min key in subtree
+		self.vertex = None
+
+
+class HandleNode:
+	"""payload of array-backed heap (mode 34); the node itself is the integer handle
+	into the columns of the heap, stored in handle upon insert"""
+	__slots__ = ("key", "handle", "vertex")
+
+	def __init__(self, key):
+		self.key = key
+		self.handle = -1
+		self.vertex = None
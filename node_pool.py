@@ -0,0 +1,34 @@
+#!/usr/bin/python3
+"""Pool of reusable heap nodes, to avoid allocating fresh nodes for every element of every run"""
+from node import Node
+
+
+class NodePool:
+	"""hands out nodes of nodeClass from a free list of released nodes;
+	handed out nodes are reset to the state of a new node"""
+
+	def __init__(self, nodeClass=Node):
+		self.nodeClass = nodeClass
+		self.nodes = []  # every node created by this pool
+		self.free = []  # released nodes, ready for reuse
+
+	def __len__(self):
+		return len(self.nodes)
+
+	def acquire(self, key):
+		"""returns reset node with given key"""
+		if self.free:
+			node = self.free.pop()
+			node.__init__(key)
+			return node
+		node = self.nodeClass(key)
+		self.nodes += [node]
+		return node
+
+	def release(self, node):
+		"""returns node to pool; node must not be in any heap anymore and must not be released twice"""
+		self.free += [node]
+
+	def reset(self):
+		"""releases all nodes of pool at once (e.g. between trials, after the heap was discarded)"""
+		self.free = self.nodes[:]
@@ -5,6 +5,7 @@ behaviour is decided upon initialisation by a type ID"""
 from pairing_heap_interface import PairingHeapInterface
 from pairing_heap_l import PairingHeapL
 from pairing_heap_standard import PairingHeapStandard
+from pairing_strategies import MULTIPASS, FRONT_TO_BACK, BACK_TO_FRONT, AUXILIARY_TWO_PASS, LAZY
 from pairing_lazy_ioana import PairingHeapLazy
 from pairing_slim import PairingSlimHeap
 from pairing_smooth import PairingSmoothHeap
@@ -12,95 +13,288 @@ from slim_heap import SlimHeap
 from slim_heap_l import SlimHeapL
 from smooth_heap import SmoothHeap
 from smooth_heap_l import SmoothHeapL
+from smooth_heap_array import SmoothHeapArray
 from splay_tree import SplayTree
+from fast_build import uninstrumented
 
 COUNT_TYPE_LINKS=-1
 COUNT_TYPE_COMPS=-2
 COUNT_TYPE_BOTH=0
+COUNT_TYPE_NONE=None  # uninstrumented build, see fast_build.py
 
 
 class PairingHeap(PairingHeapInterface):
 	MODES = {0: "Pairing_Standard", 12: "Smooth", 21: "Pairing_L", 22: "Smooth_L", 23: "Slim_L", 24: "Slim",
-			 25: "Pairing Lazy", 26: "SplayTree", 27: "PairingSlim", 28: "PairingSmooth"}
+			 25: "Pairing Lazy", 26: "SplayTree", 27: "PairingSlim", 28: "PairingSmooth", 29: "Pairing_L Multipass",
+			 30: "Pairing_L Front-to-back", 31: "Pairing_L Back-to-front", 32: "Pairing_L Auxiliary two-pass",
+			 33: "Pairing_L Lazy pairing", 34: "Smooth_Array"}
+	# variant registry: type ID -> function creating the heap from the settings of the universal heap
+	VARIANTS = {
+		0: lambda self: self.variant(PairingHeapStandard)(),
+		12: lambda self: self.variant(SmoothHeap)(policy=self.bufferPolicy, lazyMerge=self.lazyMerge),
+		21: lambda self: self.variant(PairingHeapL)(),  # root list version, everything lazy, to be used for Dijkstra test in paper
+		22: lambda self: self.variant(SmoothHeapL)(),  # root list version, everything lazy, to be used for Dijkstra test in paper
+		23: lambda self: self.variant(SlimHeapL)(),  # root list version, everything lazy, to be used for Dijkstra test in paper
+		24: lambda self: self.variant(SlimHeap)(policy=self.bufferPolicy),
+		25: lambda self: self.variant(PairingHeapLazy)(),
+		26: lambda self: self.variant(SplayTree)(),
+		27: lambda self: self.variant(PairingSlimHeap)(),
+		28: lambda self: self.variant(PairingSmoothHeap)(),
+		29: lambda self: self.variant(PairingHeapL)(strategy=MULTIPASS),  # root list versions with other consolidation strategies
+		30: lambda self: self.variant(PairingHeapL)(strategy=FRONT_TO_BACK),
+		31: lambda self: self.variant(PairingHeapL)(strategy=BACK_TO_FRONT),
+		32: lambda self: self.variant(PairingHeapL)(strategy=AUXILIARY_TWO_PASS),
+		33: lambda self: self.variant(PairingHeapL)(strategy=LAZY),
+		34: lambda self: self.variant(SmoothHeapArray)(policy=self.bufferPolicy)}  # integer handles into array columns
 	mode = 0
 	countType = COUNT_TYPE_COMPS
 	heap = None
+	bufferPolicy = None
+	lazyMerge = False
+	nodeClass = None
+	pool = None
+	stats = None  # HeapStats shared with underlying heap, see heap_stats.py
 
-	def __init__(self, mode=0, countType=COUNT_TYPE_COMPS):
+	def __init__(self, mode=0, countType=COUNT_TYPE_COMPS, bufferPolicy=None, lazyMerge=False, pool=None):
 		self.mode=mode
 		self.countType=countType
+		self.bufferPolicy=bufferPolicy  # decrease buffer policy for modes 12, 24 and 34; see buffer_policy.py
+		self.lazyMerge=lazyMerge  # for mode 12: merge keeps both buffers until next delete-min
+		self.pool=pool  # optional NodePool (see node_pool.py) used by make_node and release
+
+	@classmethod
+	def register(cls, mode, name, factory):
+		"""adds heap variant with type ID mode; factory receives the universal heap and returns the new heap,
+		whose insert, merge and decrease_key return (comps, links) and delete_min returns (node, comps, links);
+		factories instantiate self.variant(heapClass), so that uninstrumented builds are available as well"""
+		cls.MODES[mode] = name
+		cls.VARIANTS[mode] = factory
 
 	def make_heap(self):
-		if self.mode == 0:
-			self.heap = PairingHeapStandard()
-		elif self.mode == 12:
-			self.heap = SmoothHeap()
-		elif self.mode == 21:  # root list version, everything lazy, to be used for Dijkstra test in paper
-			self.heap = PairingHeapL()
-		elif self.mode == 22:  # root list version, everything lazy, to be used for Dijkstra test in paper
-			self.heap = SmoothHeapL()
-		elif self.mode == 23:
-			self.heap = SlimHeapL()  # root list version, everything lazy, to be used for Dijkstra test in paper
-		elif self.mode == 24:
-			self.heap = SlimHeap()
-		elif self.mode == 25:
-			self.heap = PairingHeapLazy()
-		elif self.mode == 26:
-			self.heap = SplayTree()
-		elif self.mode == 27:
-			self.heap = PairingSlimHeap()
-		elif self.mode == 28:
-			self.heap = PairingSmoothHeap()
-		else:
-			print(self.mode)
-			raise Exception("Invalid heap ID! No heap of type ID {} is implemented.")
+		"""creates heap of selected type and binds its operations to this heap;
+		returns node factory of the compact node type of this heap"""
+		if self.mode not in self.VARIANTS:
+			raise Exception("Invalid heap ID! No heap of type ID {} is implemented.".format(self.mode))
+		self.heap = self.VARIANTS[self.mode](self)
+		self.nodeClass = self.heap.nodeClass
+		self.bind()
+		return self.nodeClass
+
+	def variant(self, heapClass):
+		"""returns class to instantiate for heapClass: its uninstrumented build if no counts are requested"""
+		if self.countType == COUNT_TYPE_NONE:
+			return uninstrumented(heapClass)
+		return heapClass
+
+	def bind(self):
+		"""binds operations of underlying heap to this heap once, so that calls are not dispatched again;
+		all variants return counts in the same shape, only a single count type requires selecting one of them;
+		operations, links and comparisons are added up in stats, which the underlying heap shares for pointer updates;
+		without count type, results keep their shape but carry no meaningful counts, and nothing is counted"""
+		heap = self.heap
+		stats = self.stats = heap.stats
+		self.find_min = heap.find_min
+		self.iter_sorted = heap.iter_sorted
+		self.clear = heap.clear
+		self.pointer_updates = heap.pointer_updates
+		if self.countType == COUNT_TYPE_NONE:
+			self.insert = heap.insert
+			self.insert_many = heap.insert_many
+			self.insert_sorted_run = heap.insert_sorted_run
+			self.insert_runs = heap.insert_runs
+			self.delete_min = heap.delete_min
+			self.pop_k = heap.pop_k
+			self.pop_while_key_at_most = heap.pop_while_key_at_most
+			self.drain = heap.drain
+			self.merge = heap.merge
+			self.decrease_key = heap.decrease_key
+			self.decrease_keys = heap.decrease_keys
+			self.increase_key = heap.increase_key
+			self.set_key = heap.set_key
+			self.delete = heap.delete
+			return
+		index = None if self.countType == COUNT_TYPE_BOTH else 2 + self.countType  # position of selected count
+
+		def insert(node):
+			result = heap.insert(node)
+			stats.inserts += 1
+			stats.comps += result[0]
+			stats.links += result[1]
+			return result if index is None else result[index]
+
+		def batch_insert(insertion):  # counts insert_many, insert_sorted_run or insert_runs of heap
+			def insert_batch(nodes):
+				nodes = list(nodes)
+				result = insertion(nodes)
+				stats.inserts += len(nodes)
+				stats.comps += result[0]
+				stats.links += result[1]
+				return result if index is None else result[index]
+			return insert_batch
+
+		def delete_min():
+			result = heap.delete_min()
+			stats.deleteMins += 1
+			stats.comps += result[1]
+			stats.links += result[2]
+			return result if index is None else (result[0], result[1 + index])
+
+		def count_deletions(count):  # batch extraction of peelable heaps is counted apart from delete-min
+			if heap.peelable:
+				stats.peels += count
+			else:
+				stats.deleteMins += count
+
+		def pop_k(k):
+			result = heap.pop_k(k)
+			count_deletions(len(result[0]))
+			stats.comps += result[1]
+			stats.links += result[2]
+			return result if index is None else (result[0], result[1 + index])
+
+		def pop_while_key_at_most(threshold):
+			result = heap.pop_while_key_at_most(threshold)
+			count_deletions(len(result[0]))
+			stats.comps += result[1]
+			stats.links += result[2]
+			return result if index is None else (result[0], result[1 + index])
+
+		def drain():
+			for result in heap.drain():
+				count_deletions(1)
+				stats.comps += result[1]
+				stats.links += result[2]
+				yield result if index is None else (result[0], result[1 + index])
+
+		def merge(heap2):
+			result = heap.merge(heap2)  # moves counters of heap2 to stats
+			stats.merges += 1
+			stats.comps += result[0]
+			stats.links += result[1]
+			return result if index is None else result[index]
+
+		def decrease_key(node, diff):
+			result = heap.decrease_key(node, diff)
+			stats.decreaseKeys += 1
+			stats.comps += result[0]
+			stats.links += result[1]
+			return result if index is None else result[index]
+
+		def decrease_keys(nodes, diffs):
+			result = heap.decrease_keys(nodes, diffs)
+			stats.decreaseKeys += len(nodes)
+			stats.comps += result[0]
+			stats.links += result[1]
+			return result if index is None else result[index]
+
+		def increase_key(node, diff):
+			result = heap.increase_key(node, diff)
+			stats.increaseKeys += 1
+			stats.comps += result[0]
+			stats.links += result[1]
+			return result if index is None else result[index]
+
+		def set_key(node, newKey):
+			if newKey < node.key:
+				stats.decreaseKeys += 1
+			elif newKey > node.key:
+				stats.increaseKeys += 1
+			result = heap.set_key(node, newKey)
+			stats.comps += result[0]
+			stats.links += result[1]
+			return result if index is None else result[index]
+
+		def delete(node):
+			stats.deletes += 1
+			heap.delete(node)
+
+		self.insert = insert
+		self.insert_many = batch_insert(heap.insert_many)
+		self.insert_sorted_run = batch_insert(heap.insert_sorted_run)
+		self.insert_runs = batch_insert(heap.insert_runs)
+		self.delete_min = delete_min
+		self.pop_k = pop_k
+		self.pop_while_key_at_most = pop_while_key_at_most
+		self.drain = drain
+		self.merge = merge
+		self.decrease_key = decrease_key
+		self.decrease_keys = decrease_keys
+		self.increase_key = increase_key
+		self.set_key = set_key
+		self.delete = delete
+
+	def make_node(self, key):
+		"""returns new node of the compact node type of this heap (make_heap first),
+		or a recycled node from the pool if one was given"""
+		if self.pool is not None:
+			return self.pool.acquire(key)
+		return self.nodeClass(key)
+
+	def release(self, node):
+		"""returns node removed from this heap (e.g. by delete_min) to the pool, once the caller is done with it"""
+		if self.pool is not None:
+			self.pool.release(node)
 	
+	# operations below are replaced by the bound operations of the underlying heap in make_heap
+
 	def find_min(self):
 		return self.heap.find_min()
 
+	def iter_sorted(self):
+		"""yields nodes in increasing order of keys, without changing the heap"""
+		return self.heap.iter_sorted()
+
 	def insert(self, node):
 		"""inserts node; returns number of comparisons and
 		number of linking operations performed"""
-		result = self.heap.insert(node)
-		if isinstance(result, tuple):
-			if self.countType == COUNT_TYPE_BOTH:
-				return (result[0], result[1])  # (comps, links)
-			else:
-				return result[2+self.countType]
-		else:  # result should be single number iff link count and comp count are the same
-			if self.countType == COUNT_TYPE_BOTH:
-				return (result, result)
-			else:
-				return result
+		return self.heap.insert(node)
+
+	def insert_many(self, nodes):
+		"""inserts all nodes in one batch; returns number of comparisons and
+		number of linking operations performed for the whole batch"""
+		return self.heap.insert_many(nodes)
+
+	def insert_sorted_run(self, nodes):
+		"""inserts nodes given in nondecreasing order of keys, as a single tree where the variant supports it;
+		returns number of comparisons and linking operations performed"""
+		return self.heap.insert_sorted_run(nodes)
+
+	def insert_runs(self, nodes):
+		"""inserts nodes run by run, splitting them into maximal runs of nondecreasing keys;
+		returns number of comparisons and linking operations performed"""
+		return self.heap.insert_runs(nodes)
+
+	def heapify(self, keys):
+		"""inserts new nodes (see make_node) with given keys in one batch;
+		returns list of nodes and the counts of insert_many"""
+		nodes = [self.make_node(key) for key in keys]
+		result = self.insert_many(nodes)
+		if self.countType == COUNT_TYPE_BOTH or self.countType == COUNT_TYPE_NONE:
+			return (nodes, result[0], result[1])
+		return (nodes, result)
 
 	def delete_min(self):
-		"""deletes min; returns number of linking operations/comparisons performed"""
-		result = self.heap.delete_min()
-		if len(result) == 3:
-			if self.countType == COUNT_TYPE_BOTH:
-				return (result[0], result[1], result[2])  # min node, comps, links
-			else:
-				return (result[0], result[3+self.countType])
-		else:  # result should be 2-tuple iff link count and comp count are the same
-			if self.countType == COUNT_TYPE_BOTH:
-				return (result[0], result[1], result[1])
-			else:
-				return result
-		
+		"""deletes min; returns min node, number of comparisons and number of linking operations performed"""
+		return self.heap.delete_min()
+
+	def pop_k(self, k):
+		"""deletes up to k minima; returns list of deleted nodes, number of comparisons and linking operations"""
+		return self.heap.pop_k(k)
+
+	def pop_while_key_at_most(self, threshold):
+		"""deletes minima with key at most threshold; returns list of deleted nodes,
+		number of comparisons and linking operations"""
+		return self.heap.pop_while_key_at_most(threshold)
+
+	def drain(self):
+		"""deletes minima until heap is empty, yielding results of delete_min;
+		heaps peeling minima off their roots (see PairingHeapInterface.peel) must not change in between"""
+		return self.heap.drain()
+
 	def merge(self, heap2):
 		"""merges this heap and heap 2;
 		returns number of comparisons and linking operations performed"""
-		result = self.heap.merge(heap2)
-		if isinstance(result, tuple):
-			if self.countType == COUNT_TYPE_BOTH:
-				return (result[0], result[1])  # (comps, links)
-			else:
-				return result[2+self.countType]
-		else:  # should be single number iff link count and comp count are the same
-			if self.countType == COUNT_TYPE_BOTH:
-				return (result, result)
-			else:
-				return result
+		return self.heap.merge(heap2)
 
 	def delete(self, node):
 		self.heap.delete(node)
@@ -108,21 +302,26 @@ class PairingHeap(PairingHeapInterface):
 	def decrease_key(self, node, diff):
 		"""performs decrease-key;
 		returns number of comparisons and linking operations performed"""
-		result = self.heap.decrease_key(node, diff)
-		if isinstance(result, tuple):
-			if self.countType == COUNT_TYPE_BOTH:
-				if result[0] is None or result[1] is None:
-					raise Exception("heap {} returns None".format(self.MODES[self.mode]))
-				return (result[0], result[1])#(comps, links)
-			else:
-				return result[2+self.countType]
-		else:  # result should be single number iff link count and comp count are the same
-			if self.countType == COUNT_TYPE_BOTH:
-				if result is None:
-					raise Exception("heap {} returns None".format(self.MODES[self.mode]))
-				return (result, result)
-			else:
-				return result
+		return self.heap.decrease_key(node, diff)
+
+	def decrease_keys(self, nodes, diffs):
+		"""decreases key of every node by the corresponding diff (sequences or NumPy arrays);
+		returns number of comparisons and linking operations performed for the whole batch"""
+		return self.heap.decrease_keys(nodes, diffs)
+
+	def increase_key(self, node, diff):
+		"""performs increase-key: children of node move up, node is re-keyed (or deleted and inserted again);
+		returns number of comparisons and linking operations performed"""
+		return self.heap.increase_key(node, diff)
+
+	def set_key(self, node, newKey):
+		"""sets key of node, by decrease-key or increase-key as the new key requires;
+		returns number of comparisons and linking operations performed"""
+		return self.heap.set_key(node, newKey)
+
+	def clear(self):
+		"""empties heap; variants implementing clear unlink all nodes, leaving no reference cycles behind"""
+		self.heap.clear()
 
 	def pointer_updates(self):
-		return self.heap.pointer_updates()
\ No newline at end of file
+		return self.heap.pointer_updates()
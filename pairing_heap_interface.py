@@ -1,7 +1,18 @@
 #!/usr/bin/python3
 """interface implemented by all heap variants"""
+import heapq
+from frontier import Frontier
+
+
+def plain(values):
+	"""returns list of plain Python objects for NumPy arrays (anything providing tolist), else values as they are"""
+	return values.tolist() if hasattr(values, "tolist") else values
+
 
 class PairingHeapInterface:
+	exactMin = False  # whether find_min returns the minimum at all times, not only after delete_min
+	peelable = False  # whether batch extraction peels minima off the roots after consolidating once (see peel)
+
 	def __init__(self):
 		self.count = 0
 
@@ -14,14 +25,203 @@ class PairingHeapInterface:
 	def insert(self, node):
 		pass
 
+	def insert_many(self, nodes):
+		"""inserts all nodes; returns number of comparisons and links of the whole batch"""
+		compCount = 0
+		linkCount = 0
+		for node in nodes:
+			(cc, lc) = self.insert(node)
+			compCount += cc
+			linkCount += lc
+		return (compCount, linkCount)
+
+	def insert_sorted_run(self, nodes):
+		"""inserts nodes given in nondecreasing order of keys; variants link them into a single tree
+		without comparisons, otherwise they are inserted one by one; returns number of comparisons and links"""
+		return self.insert_many(nodes)
+
+	def insert_runs(self, nodes):
+		"""splits nodes into maximal runs of nondecreasing keys (one comparison per neighbouring pair)
+		and inserts each run with insert_sorted_run; returns number of comparisons and links"""
+		nodes = list(nodes)
+		compCount = max(len(nodes) - 1, 0)
+		linkCount = 0
+		start = 0
+		for i in range(1, len(nodes) + 1):
+			if i == len(nodes) or nodes[i].key < nodes[i - 1].key:
+				(cc, lc) = self.insert_sorted_run(nodes[start:i])
+				compCount += cc
+				linkCount += lc
+				start = i
+		return (compCount, linkCount)
+
+	def heapify(self, keys):
+		"""inserts new nodes with given keys; returns list of nodes, number of comparisons and links"""
+		nodes = [self.nodeClass(key) for key in keys]
+		(compCount, linkCount) = self.insert_many(nodes)
+		return (nodes, compCount, linkCount)
+
 	def delete_min(self):
 		pass
-		
+
+	def pop_k(self, k):
+		"""deletes up to k minima; returns list of deleted nodes in increasing order of keys,
+		number of comparisons and links of all deletions"""
+		nodes = []
+		compCount = 0
+		linkCount = 0
+		if k <= 0:
+			return (nodes, compCount, linkCount)
+		for (node, cc, lc) in self.drain():
+			compCount += cc
+			linkCount += lc
+			nodes += [node]
+			if len(nodes) == k:
+				break
+		return (nodes, compCount, linkCount)
+
+	def pop_while_key_at_most(self, threshold):
+		"""deletes minima as long as their key is at most threshold; returns list of deleted nodes
+		in increasing order of keys, number of comparisons and links (including the insert of the
+		first node above threshold, which is deleted and inserted again unless find_min is exact
+		or the heap is peelable)"""
+		nodes = []
+		compCount = 0
+		linkCount = 0
+		if self.peelable:
+			for (node, cc, lc) in self.peel(threshold):
+				compCount += cc
+				linkCount += lc
+				if node is not None:
+					nodes += [node]
+			return (nodes, compCount, linkCount)
+		while True:
+			if self.exactMin:
+				node = self.find_min()
+				if node is None or node.key > threshold:
+					break
+			(node, cc, lc) = self.delete_min()
+			compCount += cc
+			linkCount += lc
+			if node is None:
+				break
+			if node.key > threshold:
+				(cc, lc) = self.insert(node)
+				compCount += cc
+				linkCount += lc
+				break
+			nodes += [node]
+		return (nodes, compCount, linkCount)
+
+	def drain(self):
+		"""deletes minima until heap is empty, yielding min node, number of comparisons and links of each deletion;
+		peelable heaps must not be changed while draining"""
+		if self.peelable:
+			yield from self.peel()
+			return
+		while not (self.exactMin and self.find_min() is None):
+			result = self.delete_min()
+			if result[0] is None:
+				return
+			yield result
+
+	def peel(self, threshold=None):
+		"""deletes minima (with key at most threshold, if given) until heap is empty, consolidating only once:
+		the roots left by consolidate are kept in a frontier (see frontier.py), from which the minimum is deleted
+		by detach_root, its children joining the roots and the frontier; yields min node, number of comparisons
+		(including those of the frontier) and links of each deletion; if it stops at threshold, a last result
+		without node carries the counts not yet reported. the heap must not be changed in between"""
+		if self.exactMin:
+			node = self.find_min()
+			if node is None or (threshold is not None and node.key > threshold):
+				return
+		(compCount, linkCount) = self.consolidate()
+		frontier = Frontier(self.roots())
+		comps = 0
+		while len(frontier) > 0:
+			node = frontier.min()
+			if threshold is not None and node.key > threshold:
+				if compCount + linkCount + frontier.comps - comps > 0:
+					yield (None, compCount + frontier.comps - comps, linkCount)
+				return
+			frontier.pop()
+			for child in self.detach_root(node):
+				frontier.push(child)
+			self.set_min(frontier.min())
+			yield (node, compCount + frontier.comps - comps, linkCount)
+			comps = frontier.comps
+			compCount = 0
+			linkCount = 0
+
+	def consolidate(self):
+		"""for peelable heaps: consolidates roots as delete_min does, without deleting;
+		returns number of comparisons and links"""
+		return (0, 0)
+
+	def detach_root(self, node):
+		"""for peelable heaps: removes root node from heap, its children become roots; returns list of children"""
+		return []
+
+	def set_min(self, node):
+		"""for peelable heaps: records node as new minimum after a root was detached"""
+		pass
+
 	def merge(self, heap2):
 		pass
 
+	def decrease_key(self, node, diff):
+		pass
+
+	def decrease_keys(self, nodes, diffs):
+		"""decreases key of every node by the corresponding diff (sequences or NumPy arrays);
+		returns number of comparisons and links of the whole batch"""
+		compCount = 0
+		linkCount = 0
+		for (node, diff) in zip(plain(nodes), plain(diffs)):
+			(cc, lc) = self.decrease_key(node, diff)
+			compCount += cc
+			linkCount += lc
+		return (compCount, linkCount)
+
+	def increase_key(self, node, diff):
+		pass
+
+	def set_key(self, node, newKey):
+		"""sets key of node to newKey, by decrease-key if it is smaller and by increase-key if it is larger;
+		returns number of comparisons and links"""
+		if newKey < node.key:
+			return self.decrease_key(node, node.key - newKey)
+		if newKey > node.key:
+			return self.increase_key(node, newKey - node.key)
+		return (0, 0)
+
+	def roots(self):
+		"""returns top-level nodes, i.e. roots of all trees (including those in buffers)"""
+		return []
+
+	def children(self, node):
+		"""returns children of node"""
+		return []
+
+	def iter_sorted(self):
+		"""yields nodes in increasing order of keys without changing the heap (which must not change while iterating);
+		candidates are kept in a frontier holding the roots and the children of yielded nodes,
+		so the first k nodes cost O((r + k * d) log (r + k * d)) for r roots and children per node at most d"""
+		frontier = [(node.key, i, node) for (i, node) in enumerate(self.roots())]
+		heapq.heapify(frontier)
+		count = len(frontier)  # tie breaker, nodes themselves are not compared
+		while len(frontier) > 0:
+			node = heapq.heappop(frontier)[2]
+			yield node
+			for child in self.children(node):
+				heapq.heappush(frontier, (child.key, count, child))
+				count += 1
+
 	def delete(self, node):
 		pass
 
+	def clear(self):
+		pass
+
 	def pointer_updates(self):
 		pass
\ No newline at end of file
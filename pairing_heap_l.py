@@ -1,24 +1,37 @@
 #!/usr/bin/python3
-from node import Node
+from node import Node, PairingNode, IN_FOREST, IN_MAIN
 from pairing_heap_interface import PairingHeapInterface
+from heap_stats import HeapStats
+from root_list import RootList
+from pairing_strategies import TWO_PASS, MULTIPASS, AUXILIARY_TWO_PASS, LAZY, CONSOLIDATE, pairing_pass, two_pass, \
+    multipass
 
 
 class PairingHeapL(PairingHeapInterface):
     """lazy variant of standard pairing heap
-    (maintaining root-list and consolidating only upon extract-min)"""
-    forest = []  # list storing roots of all top-level trees
-    updates = 0
+    (maintaining root-list and consolidating only upon extract-min);
+    consolidation strategy is one of those in pairing_strategies.py"""
+    main = None  # root list of orphaned children of last deleted min, in front of forest
+    forest = None  # root list storing roots of all other top-level trees
+    strategy = TWO_PASS
+    nodeClass = PairingNode  # compact node type sufficient for this heap
+    peelable = True  # batch extraction consolidates once, then peels minima off the roots
 
-    def __init__(self, root=None):
-        self.forest = []
+    def __init__(self, root=None, strategy=TWO_PASS):
+        self.stats = HeapStats()
+        if strategy not in CONSOLIDATE and strategy not in (AUXILIARY_TWO_PASS, LAZY):
+            raise Exception("Invalid pairing strategy {}".format(strategy))
+        self.strategy = strategy
+        self.main = RootList(IN_MAIN)
+        self.forest = RootList(IN_FOREST)
         if root is not None:
             root.parent = None
-            self.updates += 1
-            self.forest += [root]
+            self.stats.updates += 1
+            self.forest.append(root)
 
     def listInorder(self):
         forestList = []
-        for root in self.forest:
+        for root in self.roots():
             forestList += [self.listInorderTree(root)]
         return forestList
 
@@ -29,138 +42,219 @@ class PairingHeapL(PairingHeapInterface):
             return self.listInorderTree(root.leftChild) + [root.key] + self.listInorderTree(root.nextSibling)
 
     def insert(self, node):
-        # concatenates node to list of trees; returns number of linking ops (always 0) for sake of consistency
+        # concatenates node to list of trees; returns number of comparisons and linking ops (always 0) for sake of consistency
         # print("trying to insert {}...".format(node.key))
         if node is None:
-            return 0
+            return (0, 0)
         node.parent = None
-        self.updates += 1
-        self.forest += [node]
-        return 0
+        self.stats.updates += 1
+        self.forest.append(node)
+        return (0, 0)
+
+    def insert_many(self, nodes):
+        """adopts list of nodes as additional roots at once; returns number of comparisons and linking ops (always 0)"""
+        nodes = list(nodes)
+        for node in nodes:
+            node.parent = None
+            self.forest.append(node)
+        self.stats.updates += len(nodes)
+        return (0, 0)
+
+    def link(self, parent, child):
+        """child becomes leftmost child of parent;
+        prevSibling of a node is its left sibling, or its parent if it is the leftmost child"""
+        if parent.leftChild is None:
+            child.parent = parent
+            self.stats.updates += 1
+        else:
+            child.nextSibling = parent.leftChild
+            self.stats.updates += 1
+            parent.leftChild.prevSibling = child
+            self.stats.updates += 1
+        parent.leftChild = child
+        self.stats.updates += 1
+        child.prevSibling = parent
+        self.stats.updates += 1
+
+    def link_roots(self, left, right):
+        """links two roots; the one with larger key becomes leftmost child of the other,
+        ties are won by left. returns new root"""
+        if left.key <= right.key:
+            self.link(left, right)
+            return left
+        else:
+            self.link(right, left)
+            return right
 
     def pairing(self):
-        """performs consolidation (left-to-right pairing pass, linking pairs of neighbours,
+        """consolidates root list into a single tree according to strategy
+        (by default left-to-right pairing pass, linking pairs of neighbours,
          followed by right-to-left combining) and returns number of linking operations"""
-        fs = len(self.forest)
+        fs = len(self.main) + len(self.forest)
         if fs < 2:
             return 0
+        main = list(self.main)
+        auxiliary = list(self.forest)
+        self.main.clear()
+        self.forest.clear()
+        if self.strategy == AUXILIARY_TWO_PASS:
+            if len(main) == 0:
+                root = multipass(auxiliary, self.link_roots)
+            elif len(auxiliary) == 0:
+                root = two_pass(main, self.link_roots)
+            else:
+                root = self.link_roots(two_pass(main, self.link_roots), multipass(auxiliary, self.link_roots))
         else:
-            # right-to-left-pairing pass
-            pairedForest = []
-            for i in range(0, fs, 2):
-                if i == fs - 1:  # last tree if length of forest is odd-numbered
-                    pairedForest += [self.forest[i]]  # concatenate to new forest (no linking required)
-                else:  # link neighbouring roots
-                    if self.forest[i].key <= self.forest[i + 1].key:
-                        if self.forest[i].leftChild == None:
-                            self.forest[i + 1].parent = self.forest[i]
-                            self.updates += 1
-                        else:
-                            self.forest[i + 1].nextSibling = self.forest[i].leftChild
-                            self.updates += 1
-                        self.forest[i].leftChild = self.forest[i + 1]
-                        self.updates += 1
-                        pairedForest += [self.forest[i]]
-                    else:
-                        if self.forest[i + 1].leftChild == None:
-                            self.forest[i].parent = self.forest[i + 1]
-                            self.updates += 1
-                        else:
-                            self.forest[i].nextSibling = self.forest[i + 1].leftChild
-                            self.updates += 1
-                        self.forest[i + 1].leftChild = self.forest[i]
-                        self.updates += 1
-                        pairedForest += [self.forest[i + 1]]
-            self.forest = pairedForest
-
-            # right-to-left combining pass
-            index = len(self.forest) - 1
-            for i in range(len(self.forest) - 2, -1, -1):  # link two rightmost roots
-                if self.forest[index].key <= self.forest[i].key:
-                    if self.forest[index].leftChild == None:
-                        self.forest[i].parent = self.forest[index]
-                        self.updates += 1
-                    else:
-                        self.forest[i].nextSibling = self.forest[index].leftChild
-                        self.updates += 1
-                    self.forest[index].leftChild = self.forest[i]
-                    self.updates += 1
-                else:
-                    if self.forest[i].leftChild == None:
-                        self.forest[index].parent = self.forest[i]
-                        self.updates += 1
-                    else:
-                        self.forest[index].nextSibling = self.forest[i].leftChild
-                        self.updates += 1
-                    self.forest[i].leftChild = self.forest[index]
-                    self.updates += 1
-                    index = i
-
-            self.forest = [self.forest[index]]
-            return (fs - 1)  # number of links needed to consolidate n roots is n-1
+            root = CONSOLIDATE[self.strategy](main + auxiliary, self.link_roots)
+        self.forest.append(root)
+        return (fs - 1)  # number of links needed to consolidate n roots is n-1
 
     def delete_min(self):
-        """finds and deletes min; restructures forest; returns number of linking operations"""
-        cn = self.pairing()
-        assert len(self.forest) == 1
-        currentSibling = self.forest[0].leftChild
+        """finds and deletes min; restructures forest;
+        returns min node, number of comparisons and number of linking operations"""
+        if len(self.main) + len(self.forest) == 0:
+            return (None, 0, 0)
+        (compCount, linkCount) = self.consolidate()
+        if self.strategy == LAZY:
+            # scan remaining roots for minimum
+            compCount += len(self.main) - 1
+            minNode = self.main.first
+            for root in self.main:
+                if root.key < minNode.key:
+                    minNode = root
+        else:
+            minNode = self.forest.first if self.main.first is None else self.main.first
+        self.detach_root(minNode)
+        return (minNode, compCount, linkCount)
+
+    def consolidate(self):
+        """consolidates roots as delete_min does: into a single tree, or with a single pairing pass
+        for the lazy strategy, whose remaining roots count as orphaned; returns number of comparisons and links"""
+        if self.strategy == LAZY:
+            fs = len(self.main) + len(self.forest)
+            roots = list(self.main) + list(self.forest)
+            self.main.clear()
+            self.forest.clear()
+            roots = pairing_pass(roots, self.link_roots)
+            for root in roots:
+                self.main.append(root)
+            linkCount = fs - len(roots)
+        else:
+            linkCount = self.pairing()
+        return (linkCount, linkCount)
+
+    def detach_root(self, node):
+        """removes root node from root list, its children become roots (orphaned children of last deleted min);
+        returns list of children"""
+        (self.main if node.location == IN_MAIN else self.forest).remove(node)
+        children = []
+        currentSibling = node.leftChild
         while currentSibling != None:
             nextSibling = currentSibling.nextSibling
-            self.forest += [currentSibling]
+            self.main.append(currentSibling)
+            children += [currentSibling]
             currentSibling.nextSibling = None
-            self.updates += 1
+            self.stats.updates += 1
+            currentSibling.prevSibling = None
+            self.stats.updates += 1
             currentSibling = nextSibling
-        self.forest[-1].parent = None  # only for the last concatenated sibling as only this one carried parent pointer
-        self.updates += 1
-        minNode = self.forest[0]
-        self.forest = self.forest[1:]
-        return (minNode, cn, cn)
+        if node.leftChild is not None:
+            self.main.last.parent = None  # only for the last concatenated sibling as only this one carried parent pointer
+            self.stats.updates += 1
+        else:
+            node.parent = None
+            self.stats.updates += 1
+        node.leftChild = None  # removed node keeps no references into heap (not counted, heap is not affected)
+        return children
 
     def decrease_key(self, node, diff):
         """unlinks node from current position in tree (if inner node),
         decreases key, adds node with subtree to root list"""
         if node is None or diff <= 0:
-            return 0
-        elif node.parent is None and node.nextSibling is None:  # node is root
+            return (0, 0)
+        elif node.prevSibling is None:  # node is root
             node.key = node.key - diff
-            self.updates += 1
+            self.stats.updates += 1
         else:
             self.unlink_node(node)
             node.key = node.key - diff
-            self.updates += 1
-            self.forest += [node]
-        return 0
+            self.stats.updates += 1
+            self.forest.append(node)
+        return (0, 0)
+
+    def increase_key(self, node, diff):
+        """moves children of node to root list and increases key of node,
+        which stays in place as a leaf (its parent's key is not larger)"""
+        child = node.leftChild
+        while child is not None:
+            nextSibling = child.nextSibling
+            self.forest.append(child)
+            child.nextSibling = None
+            self.stats.updates += 1
+            child.prevSibling = None
+            self.stats.updates += 1
+            child.parent = None
+            self.stats.updates += 1
+            child = nextSibling
+        if node.leftChild is not None:
+            node.leftChild = None
+            self.stats.updates += 1
+        node.key = node.key + diff
+        self.stats.updates += 1
+        return (0, 0)
+
+    def roots(self):
+        return list(self.main) + list(self.forest)
+
+    def children(self, node):
+        child = node.leftChild
+        while child is not None:
+            yield child
+            child = child.nextSibling
+
+    def insert_sorted_run(self, nodes):
+        """links nodes given in nondecreasing order of keys into a path without comparisons
+        and inserts it as one tree; returns number of comparisons and linking ops"""
+        nodes = list(nodes)
+        if len(nodes) == 0:
+            return (0, 0)
+        for i in range(len(nodes) - 1):
+            self.link(nodes[i], nodes[i + 1])
+        (compCount, linkCount) = self.insert(nodes[0])
+        return (compCount, linkCount + len(nodes) - 1)
 
     def merge(self, heap2):
-        """concatenates forests of this heap and heap2; returns number of link operations (always 0) for consistency"""
-        self.forest += heap2.forest
-        return 0
+        """concatenates forests of this heap and heap2; returns number of comparisons and link operations (always 0) for consistency"""
+        self.stats.absorb(heap2.stats)  # counters of heap2 move to this heap
+        self.forest.concat(heap2.main)
+        self.forest.concat(heap2.forest)
+        return (0, 0)
 
     def delete(self, node):
         """deletes node from heap; concatenates orphaned children to list of roots"""
         if node is None:
             # print("Cannot delete None")
             return
-        elif node.parent is None and node.nextSibling is None:  # node is root
+        elif node.prevSibling is None:  # node is root
             # print("Trying to delete {}...".format(node.key))
-            index = self.forest.index(node)  # slight cheating; would be nicer to use a linked list as forest instead
-            # remove node from forest list
-            self.forest = self.forest[:index] + self.forest[index + 1:]
+            (self.main if node.location == IN_MAIN else self.forest).remove(node)
         else:  # node is a child somewhere
             # print("Trying to delete {}...".format(node.key))
             self.unlink_node(node)
         # concatenate potential children to forest list
         sibling = node.leftChild
         while sibling is not None:
-            self.forest += [sibling]
+            self.forest.append(sibling)
+            sibling.prevSibling = None
+            self.stats.updates += 1
             sibling = sibling.nextSibling
             if sibling is not None:
-                self.forest[-1].nextSibling = None
-                self.updates += 1
+                self.forest.last.nextSibling = None
+                self.stats.updates += 1
             else:
-                self.forest[-1].parent = None
-                self.updates += 1
-        print("Result of deletion of {} is {}.".format(node.key, self.listInorder()))
+                self.forest.last.parent = None
+                self.stats.updates += 1
+        node.leftChild = None  # removed node keeps no references into heap
 
     def unlink_node(self, node):
         """for non-root nodes only: unlinks node from current location, re-establishes links in remaining heap
@@ -168,41 +262,26 @@ class PairingHeapL(PairingHeapInterface):
         if node == None:
             return
         else:
-            if node.nextSibling != None:
-                temp = node.nextSibling
-                while temp.nextSibling != None:  # find rightmost child
-                    temp = temp.nextSibling
-                if temp.parent.leftChild == node:  # node is leftmost child
-                    # link parent to next sibling
-                    temp.parent.leftChild = node.nextSibling
-                    self.updates += 1
-                    node.nextSibling = None
-                    self.updates += 1
-                else:
-                    # node is neither first nor last child of parent
-                    prevSibling = temp.parent.leftChild
-                    while prevSibling.nextSibling != node:  # find left (previous) sibling
-                        prevSibling = prevSibling.nextSibling
-                    prevSibling.nextSibling = node.nextSibling  # cut out node, link left and right sibling
-                    self.updates += 1
-                    node.nextSibling = None
-                    self.updates += 1
-            else:
-                # node is rightmost child of parent
-                if node.parent.leftChild == node:
-                    # node is only child: just remove
-                    node.parent.leftChild = None
-                    self.updates += 1
-                else:
-                    prevSibling = node.parent.leftChild
-                    while prevSibling.nextSibling != node:  # find left (previous) sibling
-                        prevSibling = prevSibling.nextSibling
-                    prevSibling.parent = node.parent
-                    self.updates += 1
-                    prevSibling.nextSibling = None
-                    self.updates += 1
+            prev = node.prevSibling
+            if prev.leftChild == node:  # node is leftmost child, prev is its parent
+                # link parent to next sibling
+                prev.leftChild = node.nextSibling
+                self.stats.updates += 1
+            else:  # prev is left sibling
+                prev.nextSibling = node.nextSibling  # cut out node, link left and right sibling
+                self.stats.updates += 1
+                if node.nextSibling is None:  # node is rightmost child: left sibling becomes rightmost
+                    prev.parent = node.parent
+                    self.stats.updates += 1
+            if node.nextSibling is not None:
+                node.nextSibling.prevSibling = prev
+                self.stats.updates += 1
+                node.nextSibling = None
+                self.stats.updates += 1
+            node.prevSibling = None
+            self.stats.updates += 1
             node.parent = None
-            self.updates += 1
+            self.stats.updates += 1
 
     def pointer_updates(self):
-        return self.updates
\ No newline at end of file
+        return self.stats.updates
\ No newline at end of file
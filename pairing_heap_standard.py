@@ -1,16 +1,25 @@
 #!/usr/bin/python3
-from node import Node
+from node import Node, PairingNode
 from pairing_heap_interface import PairingHeapInterface
+from heap_stats import HeapStats
+from pairing_strategies import TWO_PASS, CONSOLIDATE, multipass
 
 
 class PairingHeapStandard(PairingHeapInterface):
 	"""standard pairing heap
-	performs a left-to-right forward pass, then a backward combining pass to consolidate"""
-	updates = 0
+	performs a left-to-right forward pass, then a backward combining pass to consolidate;
+	alternatively any strategy in pairing_strategies.CONSOLIDATE"""
+	strategy = TWO_PASS
+	nodeClass = PairingNode  # compact node type sufficient for this heap
+	exactMin = True  # root is the minimum
 
-	def __init__(self, root=None):
+	def __init__(self, root=None, strategy=TWO_PASS, stats=None):
+		self.stats = stats if stats is not None else HeapStats()  # temporary heaps share the stats of their owner
+		if strategy not in CONSOLIDATE:
+			raise Exception("Invalid pairing strategy {} for standard pairing heap".format(strategy))
+		self.strategy = strategy
 		self.root = root
-		self.updates += 1
+		self.stats.updates += 1
 
 	def make_heap(self):
 		# this is equivalent to init
@@ -29,122 +38,240 @@ class PairingHeapStandard(PairingHeapInterface):
 
 	def insert(self, node):
 		""" inserts node by linking to current root,
-		returns number of link operations"""
+		returns number of comparisons and link operations (one comparison per link)"""
 		linkCount = 0
 		if self.root is None:
 			# heap was empty before
 			self.root = node
-			self.updates += 1
+			self.stats.updates += 1
 		else:
-			newheap = PairingHeapStandard(node)
-			linkCount = self.merge(newheap)
+			winner = self.link_roots(self.root, node)
+			if winner is not self.root:
+				self.root = winner
+				self.stats.updates += 1
+			linkCount = 1
 		# print(self.listInorder(self.root))
-		return linkCount
+		return (linkCount, linkCount)
 
 	def delete_min(self):
 		"""Extracts minimum (current root), consolidates orphaned children.
-		returns number of link operations"""
+		returns min node, number of comparisons and number of link operations"""
 		linkCount = 0  # counts number of linking operations
 		minNode = None
 		if self.root is None:
 			print("Heap was already empty.")
-			return (minNode, linkCount)
+			return (minNode, linkCount, linkCount)
 		elif self.root.leftChild is None:
 			# heap contained only one element
 			minNode = self.root
 			self.root = None
-			self.updates += 1
-			return (minNode, linkCount)
+			self.stats.updates += 1
+			return (minNode, linkCount, linkCount)
 		elif self.root.leftChild.nextSibling is None:
 			# first child has no siblings->first child becomes root
 			minNode = self.root
 			self.root = self.root.leftChild
-			self.updates += 1
+			self.stats.updates += 1
 			self.root.parent = None
-			self.updates += 1
-			return (minNode, linkCount)
+			self.stats.updates += 1
+			self.root.prevSibling = None
+			self.stats.updates += 1
+			return (minNode, linkCount, linkCount)
+		elif self.strategy != TWO_PASS:
+			minNode = self.root
+			children = []
+			current = self.root.leftChild
+			while current is not None:
+				children += [current]
+				current = current.nextSibling
+			combined = CONSOLIDATE[self.strategy](children, self.link_roots)
+			linkCount = len(children) - 1
+			combined.nextSibling = None
+			self.stats.updates += 1
+			self.root = combined
+			self.stats.updates += 1
+			self.root.parent = None
+			self.stats.updates += 1
+			self.root.prevSibling = None
+			self.stats.updates += 1
 		else:
 			minNode = self.root
-			self.root = self.root.leftChild
-			self.updates += 1
-			current = self.root
-			nextSibling = None
-			heaps = []
-			paired = []
-			# left-to-right pairing pass
-			while current is not None:  # create heaps of all orphaned children
-				nextSibling = current.nextSibling
-				heaps += [PairingHeapStandard(current)]
-				current.nextSibling = None
-				self.updates += 1
-				current = nextSibling
-			for j in range(0, len(heaps), 2):
-				if j == (len(heaps) - 1):  # last one
-					paired += [heaps[j]]
+			first = self.root.leftChild
+			# left-to-right pairing pass; winners of pairs are chained through nextSibling
+			# in reverse order, so that the combining pass can follow the chain
+			paired = None
+			current = first
+			while current is not None:
+				if current.nextSibling is None:  # last one
+					winner = current
+					current = None
 				else:
-					heap = heaps[j]
-					linkCount += heap.merge(heaps[j + 1])  # merge returns its number of link operations
-					paired += [heap]
-			# combining backwards (right-to-left) pass
-			combined = paired[-1]  # start with last (rightmost) tree
-			for i in range(len(paired) - 2, -1, -1):
-				linkCount += combined.merge(paired[i])  # merge returns its number of link operations
-			self.root = combined.root
-			self.updates += 1
+					right = current.nextSibling
+					nextSibling = right.nextSibling
+					winner = self.link_roots(current, right)
+					linkCount += 1
+					current = nextSibling
+				winner.nextSibling = paired
+				self.stats.updates += 1
+				paired = winner
+			# combining backwards (right-to-left) pass, starting with last (rightmost) tree
+			combined = paired
+			current = paired.nextSibling
+			while current is not None:
+				nextPaired = current.nextSibling
+				combined = self.link_roots(combined, current)
+				linkCount += 1
+				current = nextPaired
+			combined.nextSibling = None
+			self.stats.updates += 1
+			self.root = combined
+			self.stats.updates += 1
 			self.root.parent = None
-			self.updates += 1
-		return (minNode, linkCount)
+			self.stats.updates += 1
+			self.root.prevSibling = None
+			self.stats.updates += 1
+		return (minNode, linkCount, linkCount)
+
+	def insert_many(self, nodes):
+		"""links current root and all nodes in a balanced tournament (pairing passes until one tree remains);
+		returns number of comparisons and link operations (one comparison per link)"""
+		roots = list(nodes)
+		if len(roots) == 0:
+			return (0, 0)
+		if self.root is not None:
+			roots = [self.root] + roots
+		linkCount = len(roots) - 1
+		self.root = multipass(roots, self.link_roots)
+		self.stats.updates += 1
+		return (linkCount, linkCount)
+
+	def roots(self):
+		return [] if self.root is None else [self.root]
+
+	def children(self, node):
+		child = node.leftChild
+		while child is not None:
+			yield child
+			child = child.nextSibling
+
+	def insert_sorted_run(self, nodes):
+		"""links nodes given in nondecreasing order of keys into a path without comparisons,
+		then links path to root; returns number of comparisons and link operations"""
+		nodes = list(nodes)
+		if len(nodes) == 0:
+			return (0, 0)
+		for i in range(len(nodes) - 1):  # next node becomes only child
+			nodes[i].leftChild = nodes[i + 1]
+			nodes[i + 1].prevSibling = nodes[i]
+			nodes[i + 1].parent = nodes[i]
+			self.stats.updates += 3
+		(compCount, linkCount) = self.insert(nodes[0])
+		return (compCount, linkCount + len(nodes) - 1)
 
 	def merge(self, heap2):
 		"""merges heap2 with current heap by linking roots.
-		returns number of link operations"""
+		returns number of comparisons and link operations"""
+		self.stats.absorb(heap2.stats)  # counters of heap2 move to this heap
 		linkCount = 0  # counts number of linking operations
 		if self.root is None:  # heap is empty
 			self.root = heap2.root
-			self.updates += 1
+			self.stats.updates += 1
 		elif heap2.root is None:  # heap 2 is empty
 			pass  # this heap is the result
 		else:
 			# link roots
-			if self.root.key <= heap2.root.key:
-				heap2.root.nextSibling = self.root.leftChild
-				self.updates += 1
-				if heap2.root.nextSibling is None:
-					heap2.root.parent = self.root
-					self.updates += 1
-				self.root.leftChild = heap2.root
-				self.updates += 1
-				linkCount = 1
+			winner = self.link_roots(self.root, heap2.root)
+			if winner is not self.root:
+				self.root = winner
+				self.stats.updates += 1
+			linkCount = 1
+		return (linkCount, linkCount)
+
+	def link_roots(self, left, right):
+		"""links two roots; the one with larger key becomes leftmost child of the other,
+		ties are won by left. returns new root"""
+		if left.key <= right.key:
+			right.nextSibling = left.leftChild
+			self.stats.updates += 1
+			if right.nextSibling is None:
+				right.parent = left
+				self.stats.updates += 1
+			else:
+				right.nextSibling.prevSibling = right
+				self.stats.updates += 1
+			left.leftChild = right
+			self.stats.updates += 1
+			right.prevSibling = left
+			self.stats.updates += 1
+			return left
+		else:
+			left.nextSibling = right.leftChild
+			self.stats.updates += 1
+			if left.nextSibling is None:
+				left.parent = right
+				self.stats.updates += 1
 			else:
-				self.root.nextSibling = heap2.root.leftChild
-				self.updates += 1
-				if self.root.nextSibling is None:
-					self.root.parent = heap2.root
-					self.updates += 1
-				heap2.root.leftChild = self.root
-				self.updates += 1
-				self.root = heap2.root
-				self.updates += 1
-				linkCount = 1
-		return linkCount
+				left.nextSibling.prevSibling = left
+				self.stats.updates += 1
+			right.leftChild = left
+			self.stats.updates += 1
+			left.prevSibling = right
+			self.stats.updates += 1
+			return right
 
 	def decrease_key(self, node, diff):
 		"""cuts node with subtree from current place in tree;
-		decreases key; links node to root"""
+		decreases key; links node to root.
+		returns number of comparisons and link operations"""
 		linkCount = 0
 		if self.root == node:
 			self.root.key = self.root.key - diff
-			self.updates += 1
+			self.stats.updates += 1
 		else:
 			# first step: cut node from heap
 			self.unlink_node(node)  # helper function
 			# second step: decrease key
-			subheap = PairingHeapStandard(node)
-			subheap.root.key = subheap.root.key - diff
-			self.updates += 1
-			# third step: merge back in
-			linkCount = self.merge(subheap)
-		return linkCount
+			node.key = node.key - diff
+			self.stats.updates += 1
+			# third step: link back to root
+			winner = self.link_roots(self.root, node)
+			if winner is not self.root:
+				self.root = winner
+				self.stats.updates += 1
+			linkCount = 1
+		return (linkCount, linkCount)
+
+	def increase_key(self, node, diff):
+		"""consolidates children of node into one tree, which is linked to root, and increases key of node,
+		which stays in place as a leaf (its parent's key is not larger); the root is deleted and inserted again instead.
+		returns number of comparisons and link operations"""
+		if self.root == node:
+			(minNode, compCount, linkCount) = self.delete_min()
+			node.leftChild = None
+			self.stats.updates += 1
+			node.key = node.key + diff
+			self.stats.updates += 1
+			(cc, lc) = self.insert(node)
+			return (compCount + cc, linkCount + lc)
+		children = list(self.children(node))
+		node.key = node.key + diff
+		self.stats.updates += 1
+		if len(children) == 0:
+			return (0, 0)
+		node.leftChild = None
+		self.stats.updates += 1
+		for child in children:
+			child.nextSibling = None
+			child.prevSibling = None
+		self.stats.updates += 2 * len(children)
+		combined = CONSOLIDATE[self.strategy](children, self.link_roots)
+		linkCount = len(children) - 1
+		winner = self.link_roots(self.root, combined)
+		if winner is not self.root:
+			self.root = winner
+			self.stats.updates += 1
+		linkCount += 1
+		return (linkCount, linkCount)
 
 	def delete(self, node):
 		"""removes node with subtree from current place in tree;
@@ -153,57 +280,44 @@ class PairingHeapStandard(PairingHeapInterface):
 		returns number of link operations"""
 		if node is None:
 			return 0
-		if self.root.key == node.key:
-			(minNode, lc) = self.delete_min()
+		if self.root == node:
+			(minNode, cc, lc) = self.delete_min()
 			return lc
 		else:
 			self.unlink_node(node)  # helper function
 
-			subheap = PairingHeapStandard(node)
-			linkCount = subheap.delete_min()
-			linkCount += self.merge(subheap)
+			subheap = PairingHeapStandard(node, strategy=self.strategy, stats=self.stats)
+			(minNode, compCount, linkCount) = subheap.delete_min()
+			linkCount += self.merge(subheap)[1]
 			return linkCount
 
 	def unlink_node(self, node):
-		"""removes node from heap, updating pointers accordingly"""
+		"""removes node from heap, updating pointers accordingly;
+		prevSibling of a node is its left sibling, or its parent if it is the leftmost child"""
 		if self.root == node:  # remove the whole heap
 			self.root = None
-			self.updates += 1
+			self.stats.updates += 1
 		else:
-			if node.nextSibling != None:
-				temp = node.nextSibling
-				while temp.nextSibling != None:
-					temp = temp.nextSibling
-				if temp.parent.leftChild == node:  # node is leftmost child
-					# link parent to next sibling
-					temp.parent.leftChild = node.nextSibling
-					self.updates += 1
-					node.nextSibling = None
-					self.updates += 1
-				else:
-					# node is neither first nor last child of parent
-					prevSibling = temp.parent.leftChild
-					while prevSibling.nextSibling != node:  # find left (previous) sibling
-						prevSibling = prevSibling.nextSibling
-						self.updates += 1
-					prevSibling.nextSibling = node.nextSibling  # cut out node, link left and right sibling
-					self.updates += 1
-			else:
-				# node is rightmost child of parent
-				if node.parent.leftChild == node:
-					# node is only child: just remove
-					node.parent.leftChild = None
-					self.updates += 1
-				else:
-					prevSibling = node.parent.leftChild
-					while prevSibling.nextSibling != node:  # find left (previous) sibling
-						prevSibling = prevSibling.nextSibling
-					prevSibling.parent = node.parent
-					self.updates += 1
-					prevSibling.nextSibling = None
-					self.updates += 1
+			prev = node.prevSibling
+			if prev.leftChild == node:  # node is leftmost child, prev is its parent
+				# link parent to next sibling
+				prev.leftChild = node.nextSibling
+				self.stats.updates += 1
+			else:  # prev is left sibling
+				prev.nextSibling = node.nextSibling  # cut out node, link left and right sibling
+				self.stats.updates += 1
+				if node.nextSibling is None:  # node is rightmost child: left sibling becomes rightmost
+					prev.parent = node.parent
+					self.stats.updates += 1
+			if node.nextSibling is not None:
+				node.nextSibling.prevSibling = prev
+				self.stats.updates += 1
+				node.nextSibling = None
+				self.stats.updates += 1
+			node.prevSibling = None
+			self.stats.updates += 1
 			node.parent = None
-			self.updates += 1
+			self.stats.updates += 1
 
 	def pointer_updates(self):
-		return self.updates
\ No newline at end of file
+		return self.stats.updates
\ No newline at end of file
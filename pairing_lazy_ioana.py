@@ -1,22 +1,27 @@
 #!/usr/bin/python3
-from node import Node
+from node import Node, PairingNode, IN_FOREST
 from pairing_heap_interface import PairingHeapInterface
+from heap_stats import HeapStats
+from root_list import RootList
 
 
 class PairingHeapLazy(PairingHeapInterface):
     """lazy variant of standard pairing heap
     (maintaining root-list and min-root pointer and consolidating only upon extract-min)"""
-    forest = []  # list storing roots of all top-level trees
+    forest = None  # root list storing roots of all top-level trees
     minNode = None
-    minNodeIndex = -1
-    updates = 0
+    nodeClass = PairingNode  # compact node type sufficient for this heap
+    exactMin = True  # min node is kept up to date by every operation
+    peelable = True  # batch extraction consolidates once, then peels minima off the roots
 
     def __init__(self, root=None):
-        self.forest = []
+        self.stats = HeapStats()
+        self.forest = RootList(IN_FOREST)
         if root is not None:
             root.parent = None
-            self.updates += 1
-            self.forest += [root]
+            self.stats.updates += 1
+            self.forest.append(root)
+            self.minNode = root
 
     def listInorder(self):
         forestList = []
@@ -31,170 +36,239 @@ class PairingHeapLazy(PairingHeapInterface):
             return self.listInorderTree(root.leftChild) + [root.key] + self.listInorderTree(root.nextSibling)
 
     def insert(self, node):
-        # concatenates node to list of trees; returns number of linking ops (always 0) for sake of consistency
+        # concatenates node to list of trees; returns number of comparisons and linking ops (always 0) for sake of consistency
         # print("trying to insert {}...".format(node.key))
         if node is None:
-            return 0
+            return (0, 0)
         node.parent = None
-        self.updates += 1
-        self.forest += [node]
+        self.stats.updates += 1
+        self.forest.append(node)
         if self.minNode is None or node.key <= self.minNode.key:
             self.minNode = node
-            self.updates += 1
-            self.minNodeIndex = len(self.forest) - 1
-        return 0
+            self.stats.updates += 1
+        return (0, 0)
+
+    def insert_many(self, nodes):
+        """appends all nodes to root list, keeping track of min; returns number of comparisons and linking ops (always 0)"""
+        minNode = self.minNode
+        for node in nodes:
+            node.parent = None
+            self.stats.updates += 1
+            self.forest.append(node)
+            if minNode is None or node.key <= minNode.key:
+                minNode = node
+        if minNode is not self.minNode:
+            self.minNode = minNode
+            self.stats.updates += 1
+        return (0, 0)
+
+    def link(self, parent, child):
+        """child becomes leftmost child of parent;
+        prevSibling of a node is its left sibling, or its parent if it is the leftmost child"""
+        if parent.leftChild is None:
+            child.parent = parent
+            self.stats.updates += 1
+        else:
+            child.nextSibling = parent.leftChild
+            self.stats.updates += 1
+            parent.leftChild.prevSibling = child
+            self.stats.updates += 1
+        parent.leftChild = child
+        self.stats.updates += 1
+        child.prevSibling = parent
+        self.stats.updates += 1
 
     def pairing(self):
-        """performs consolidation left-to-right pairing pass, linking pairs of neighbours,
-          and returns current minimum and number of linking operations"""
+        """performs consolidation left-to-right pairing pass, linking pairs of neighbours in place
+        (the loser of each pair leaves the root list), sets current minimum
+        and returns number of linking operations"""
         fs = len(self.forest)
-        if fs < 2:
-            currentMin = self.forest[0]
-            return 0
-        else:
-            # right-to-left-pairing pass
-            pairedForest = []
-            currentMin = self.forest[0]
-            links = 0
-            # print(self.listInorder())
-            for i in range(0, fs, 2):
-                if i == fs - 1:  # last tree if length of forest is odd-numbered
-                    if self.forest[i].key < currentMin.key:
-                        currentMin = self.forest[i]
-                    pairedForest += [self.forest[i]]  # concatenate to new forest (no linking required)
-                else:  # link neighbouring roots
-                    if self.forest[i].key <= self.forest[i + 1].key:
-                        if self.forest[i].leftChild == None:
-                            self.forest[i + 1].parent = self.forest[i]
-                            self.updates += 1
-                        else:
-                            self.forest[i + 1].nextSibling = self.forest[i].leftChild
-                            self.updates += 1
-                        self.forest[i].leftChild = self.forest[i + 1]
-                        self.updates += 1
-                        if self.forest[i].key < currentMin.key:
-                            currentMin = self.forest[i]
-                        # print(self.forest[i])
-                        pairedForest += [self.forest[i]]
-                    else:
-                        if self.forest[i + 1].leftChild == None:
-                            self.forest[i].parent = self.forest[i + 1]
-                            self.updates += 1
-                        else:
-                            self.forest[i].nextSibling = self.forest[i + 1].leftChild
-                            self.updates += 1
-                        self.forest[i + 1].leftChild = self.forest[i]
-                        self.updates += 1
-                        if self.forest[i + 1].key < currentMin.key:
-                            currentMin = self.forest[i + 1]
-                        # print(self.forest[i + 1])
-                        pairedForest += [self.forest[i + 1]]
-            self.forest = pairedForest
-            # print(self.listInorder())
-            self.minNode = currentMin
-            self.updates += 1
-            self.minNodeIndex = self.forest.index(self.minNode)
-            # print("index is ", self.minNodeIndex)
-            # print("forest length is ", len(self.forest))
-            return (fs / 2)  # number of links needed to consolidate n roots
+        currentMin = self.forest.first
+        current = self.forest.first
+        while current is not None:
+            if current.nextRoot is None:  # last tree if length of forest is odd-numbered
+                if current.key < currentMin.key:
+                    currentMin = current
+                break
+            neighbour = current.nextRoot
+            nextPair = neighbour.nextRoot
+            if current.key <= neighbour.key:  # link neighbouring roots
+                self.forest.remove(neighbour)
+                self.link(current, neighbour)
+                winner = current
+            else:
+                self.forest.remove(current)
+                self.link(neighbour, current)
+                winner = neighbour
+            if winner.key < currentMin.key:
+                currentMin = winner
+            current = nextPair
+        self.minNode = currentMin
+        self.stats.updates += 1
+        return (fs / 2)  # number of links needed to consolidate n roots
 
     def find_min(self):
         return self.minNode
 
     def delete_min(self):
-        # print(self.listInorder())
         if self.minNode == None:
-            print("Cannot delete empty heap")
-            return
+            return (None, 0, 0)
 
-        # print(self.minNode.key)
-        index = self.minNodeIndex
-        # print("index", index)
-        # print("forestsize", len(self.forest))
-        currentSibling = self.forest[index].leftChild
         oldMinNode = self.minNode
+        self.detach_root(oldMinNode)
 
-        # remove minNode from forest
-        # print("index removed", index)
-        if index == 0:
-            self.forest = self.forest[1:]
-        elif index == len(self.forest) - 1:
-            self.forest = self.forest[:index]
-        else:
-            self.forest = self.forest[:index] + self.forest[(index + 1):]
-
-        # move all children of deleted root in front of the other roots
-        while currentSibling != None:
-            nextSibling = currentSibling.nextSibling
-            self.forest.insert(0, currentSibling)
-            currentSibling.nextSibling = None
-            self.updates += 1
-            # print(self.forest[0])
-            self.forest[0].parent = None
-            self.updates += 1
-            currentSibling = nextSibling
-
-        # print("forest length before pairing", len(self.forest))
         if len(self.forest) > 1:
             cn = self.pairing()
             return (oldMinNode, cn*2, cn)
         elif len(self.forest) == 1:
-            self.minNodeIndex = 0
-            self.minNode = self.forest[0]
-            self.updates += 1
+            self.minNode = self.forest.first
+            self.stats.updates += 1
             return (oldMinNode, 0, 0)
         else:
+            self.minNode = None
+            self.stats.updates += 1
             return (oldMinNode, 0, 0)
 
+    def consolidate(self):
+        """performs the pairing pass of delete_min without deleting; returns number of comparisons and links"""
+        if len(self.forest) > 1:
+            cn = self.pairing()
+            return (cn*2, cn)
+        return (0, 0)
+
+    def detach_root(self, node):
+        """removes root node from root list, moving its children in front of the other roots;
+        returns list of children"""
+        children = []
+        currentSibling = node.leftChild
+        self.forest.remove(node)
+        while currentSibling != None:
+            nextSibling = currentSibling.nextSibling
+            self.forest.prepend(currentSibling)
+            children += [currentSibling]
+            currentSibling.nextSibling = None
+            self.stats.updates += 1
+            currentSibling.prevSibling = None
+            self.stats.updates += 1
+            currentSibling.parent = None
+            self.stats.updates += 1
+            currentSibling = nextSibling
+        node.leftChild = None
+        return children
+
+    def set_min(self, node):
+        self.minNode = node
+        self.stats.updates += 1
+
     def decrease_key(self, node, diff):
         """unlinks node from current position in tree (if inner node),
         decreases key, adds node with subtree to root list"""
         if node is None or diff <= 0:
-            return 0
-        elif node.parent is None and node.nextSibling is None:  # node is root
+            return (0, 0)
+        elif node.prevSibling is None:  # node is root
             node.key = node.key - diff
-            self.updates += 1
+            self.stats.updates += 1
             if node.key < self.minNode.key:
                 self.minNode = node
-                self.updates += 1
+                self.stats.updates += 1
         else:
             self.unlink_node(node)
             node.key = node.key - diff
-            self.updates += 1
+            self.stats.updates += 1
             if node.key < self.minNode.key:
                 self.minNode = node
-                self.updates += 1
-            self.forest += [node]
-        return 0
+                self.stats.updates += 1
+            self.forest.append(node)
+        return (0, 0)
+
+    def increase_key(self, node, diff):
+        """moves children of node to root list and increases key of node,
+        which stays in place as a leaf (its parent's key is not larger);
+        the min node is deleted and inserted again instead"""
+        if node is self.minNode:
+            (minNode, compCount, linkCount) = self.delete_min()
+            node.key = node.key + diff
+            self.stats.updates += 1
+            self.insert(node)
+            return (compCount, linkCount)
+        child = node.leftChild
+        while child is not None:
+            nextSibling = child.nextSibling
+            self.forest.append(child)
+            child.nextSibling = None
+            self.stats.updates += 1
+            child.prevSibling = None
+            self.stats.updates += 1
+            child.parent = None
+            self.stats.updates += 1
+            child = nextSibling
+        if node.leftChild is not None:
+            node.leftChild = None
+            self.stats.updates += 1
+        node.key = node.key + diff
+        self.stats.updates += 1
+        return (0, 0)
+
+    def roots(self):
+        return self.forest
+
+    def children(self, node):
+        child = node.leftChild
+        while child is not None:
+            yield child
+            child = child.nextSibling
+
+    def insert_sorted_run(self, nodes):
+        """links nodes given in nondecreasing order of keys into a path without comparisons
+        and inserts it as one tree; returns number of comparisons and linking ops"""
+        nodes = list(nodes)
+        if len(nodes) == 0:
+            return (0, 0)
+        for i in range(len(nodes) - 1):
+            self.link(nodes[i], nodes[i + 1])
+        (compCount, linkCount) = self.insert(nodes[0])
+        return (compCount, linkCount + len(nodes) - 1)
 
     def merge(self, heap2):
-        """concatenates forests of this heap and heap2; returns number of link operations (always 0) for consistency"""
-        self.forest += heap2.forest
-        return 0
+        """concatenates forests of this heap and heap2; returns number of comparisons and link operations (always 0) for consistency"""
+        self.stats.absorb(heap2.stats)  # counters of heap2 move to this heap
+        self.forest.concat(heap2.forest)
+        if self.minNode is None or (heap2.minNode is not None and heap2.minNode.key < self.minNode.key):
+            self.minNode = heap2.minNode
+            self.stats.updates += 1
+        return (0, 0)
 
     def delete(self, node):
-        """deletes node from heap; concatenates orphaned children to list of roots"""
+        """deletes node from heap; concatenates orphaned children to list of roots;
+        if node was the min node, the new min node is found by scanning the roots"""
         if node is None:
             # print("Cannot delete None")
             return
-        elif node.parent is None and node.nextSibling is None:  # node is root
+        elif node.prevSibling is None:  # node is root
             # print("Trying to delete {}...".format(node.key))
-            index = self.forest.index(node)  # slight cheating; would be nicer to use a linked list as forest instead
-            # remove node from forest list
-            self.forest = self.forest[:index] + self.forest[index + 1:]
+            self.forest.remove(node)
         else:  # node is a child somewhere
             # print("Trying to delete {}...".format(node.key))
             self.unlink_node(node)
         # concatenate potential children to forest list
         sibling = node.leftChild
         while sibling is not None:
-            self.forest += [sibling]
-            sibling = sibling.nextSibling
-            if sibling is not None:
-                self.forest[-1].nextSibling = None
+            self.forest.append(sibling)
+            sibling.prevSibling = None
+            self.stats.updates += 1
+            nextSibling = sibling.nextSibling
+            if nextSibling is not None:
+                sibling.nextSibling = None
             else:
-                self.forest[-1].parent = None
-        print("Result of deletion of {} is {}.".format(node.key, self.listInorder()))
+                sibling.parent = None
+            sibling = nextSibling
+        node.leftChild = None  # removed node keeps no references into heap
+        if node is self.minNode:
+            self.minNode = None
+            for root in self.forest:
+                if self.minNode is None or root.key < self.minNode.key:
+                    self.minNode = root
+            self.stats.updates += 1
 
     def unlink_node(self, node):
         """for non-root nodes only: unlinks node from current location, re-establishes links in remaining heap
@@ -202,41 +276,26 @@ class PairingHeapLazy(PairingHeapInterface):
         if node == None:
             return
         else:
-            if node.nextSibling != None:
-                temp = node.nextSibling
-                while temp.nextSibling != None:  # find rightmost child
-                    temp = temp.nextSibling
-                if temp.parent.leftChild == node:  # node is leftmost child
-                    # link parent to next sibling
-                    temp.parent.leftChild = node.nextSibling
-                    self.updates += 1
-                    node.nextSibling = None
-                else:
-                    # node is neither first nor last child of parent
-                    prevSibling = temp.parent.leftChild
-                    while prevSibling.nextSibling != node:  # find left (previous) sibling
-                        prevSibling = prevSibling.nextSibling
-                        self.updates += 1
-                    prevSibling.nextSibling = node.nextSibling  # cut out node, link left and right sibling
-                    self.updates += 1
-                    node.nextSibling = None
-                    self.updates += 1
-            else:
-                # node is rightmost child of parent
-                if node.parent.leftChild == node:
-                    # node is only child: just remove
-                    node.parent.leftChild = None
-                    self.updates += 1
-                else:
-                    prevSibling = node.parent.leftChild
-                    while prevSibling.nextSibling != node:  # find left (previous) sibling
-                        prevSibling = prevSibling.nextSibling
-                    prevSibling.parent = node.parent
-                    self.updates += 1
-                    prevSibling.nextSibling = None
-                    self.updates += 1
+            prev = node.prevSibling
+            if prev.leftChild == node:  # node is leftmost child, prev is its parent
+                # link parent to next sibling
+                prev.leftChild = node.nextSibling
+                self.stats.updates += 1
+            else:  # prev is left sibling
+                prev.nextSibling = node.nextSibling  # cut out node, link left and right sibling
+                self.stats.updates += 1
+                if node.nextSibling is None:  # node is rightmost child: left sibling becomes rightmost
+                    prev.parent = node.parent
+                    self.stats.updates += 1
+            if node.nextSibling is not None:
+                node.nextSibling.prevSibling = prev
+                self.stats.updates += 1
+                node.nextSibling = None
+                self.stats.updates += 1
+            node.prevSibling = None
+            self.stats.updates += 1
             node.parent = None
-            self.updates += 1
+            self.stats.updates += 1
 
     def pointer_updates(self):
-        return self.updates
\ No newline at end of file
+        return self.stats.updates
\ No newline at end of file
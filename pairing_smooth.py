@@ -1,24 +1,28 @@
 #!/usr/bin/python3
-from node import Node
+from node import Node, SmoothNode
 import math
 from pairing_heap_interface import PairingHeapInterface
+from heap_stats import HeapStats
 
 
 class PairingSmoothHeap(PairingHeapInterface):
     """lazy implementation of smooth heap without buffer"""
     forest = []  # list storing roots of all top-level trees
     minNode = None
-    updates = 0
+    nodeClass = SmoothNode  # compact node type sufficient for this heap
 
     def __init__(self, root=None):
+        self.stats = HeapStats()
         self.forest = []
         if root != None:
             root.parent = None
-            self.updates += 1
+            self.stats.updates += 1
             root.nextSibling = root
-            self.updates += 1
+            self.stats.updates += 1
+            root.prevSibling = root
+            self.stats.updates += 1
             self.minNode = root
-            self.updates += 1
+            self.stats.updates += 1
             self.forest += [root]
 
     def make_heap(self):
@@ -51,47 +55,115 @@ class PairingSmoothHeap(PairingHeapInterface):
         """left node becomes parent of right node"""
         if left.rightChild != None:
             right.nextSibling = left.rightChild.nextSibling
-            self.updates += 1
+            self.stats.updates += 1
+            right.nextSibling.prevSibling = right
+            self.stats.updates += 1
             left.rightChild.nextSibling = right
-            self.updates += 1
+            self.stats.updates += 1
+            right.prevSibling = left.rightChild
+            self.stats.updates += 1
         else:
             right.nextSibling = right
-            self.updates += 1
+            self.stats.updates += 1
+            right.prevSibling = right
+            self.stats.updates += 1
         left.rightChild = right
-        self.updates += 1
+        self.stats.updates += 1
         right.parent = left
-        self.updates += 1
+        self.stats.updates += 1
 
     def stable_link_right(self, left, right):
         """right node becomes parent of left node"""
         if right.rightChild is None:
             right.rightChild = left
-            self.updates += 1
+            self.stats.updates += 1
             left.nextSibling = left
-            self.updates += 1
+            self.stats.updates += 1
+            left.prevSibling = left
+            self.stats.updates += 1
         else:
             left.nextSibling = right.rightChild.nextSibling
-            self.updates += 1
+            self.stats.updates += 1
+            left.nextSibling.prevSibling = left
+            self.stats.updates += 1
             right.rightChild.nextSibling = left
-            self.updates += 1
+            self.stats.updates += 1
+            left.prevSibling = right.rightChild
+            self.stats.updates += 1
         left.parent = right
-        self.updates += 1
+        self.stats.updates += 1
 
     def insert(self, node):
         """concatenates node to list of trees in pool"""
         if node is None:
             return (0, 0)  # no comparisons, no links
         node.nextSibling = node
-        self.updates += 1
+        self.stats.updates += 1
+        node.prevSibling = node
+        self.stats.updates += 1
         node.parent = None
-        self.updates += 1
+        self.stats.updates += 1
         self.forest += [node]
         return (0, 0)  # 1 comparison, no links
 
+    def insert_many(self, nodes):
+        """adopts list of nodes as additional roots at once (each a single-node sibling ring)"""
+        nodes = list(nodes)
+        for node in nodes:
+            node.nextSibling = node
+            node.prevSibling = node
+            node.parent = None
+        self.stats.updates += 3 * len(nodes)
+        self.forest += nodes
+        return (0, 0)  # no comparisons, no links
+
+    def increase_key(self, node, diff):
+        """moves children of node to root list and increases key of node,
+        which stays in place as a leaf (its parent's key is not larger)"""
+        children = list(self.children(node))
+        for child in children:
+            child.nextSibling = child
+            self.stats.updates += 1
+            child.prevSibling = child
+            self.stats.updates += 1
+            child.parent = None
+            self.stats.updates += 1
+        self.forest += children
+        if node.rightChild is not None:
+            node.rightChild = None
+            self.stats.updates += 1
+        node.key = node.key + diff
+        self.stats.updates += 1
+        return (0, 0)
+
+    def roots(self):
+        return self.forest
+
+    def children(self, node):
+        if node.rightChild is not None:
+            child = node.rightChild.nextSibling  # leftmost child
+            while True:
+                yield child
+                if child is node.rightChild:
+                    break
+                child = child.nextSibling
+
+    def insert_sorted_run(self, nodes):
+        """links nodes given in nondecreasing order of keys into a path (the tree treapify would build from them) without comparisons
+        and inserts it as one tree; returns number of comparisons and linking ops"""
+        nodes = list(nodes)
+        if len(nodes) == 0:
+            return (0, 0)
+        for i in range(len(nodes) - 1):
+            self.stable_link_left(nodes[i], nodes[i + 1])
+        (compCount, linkCount) = self.insert(nodes[0])
+        return (compCount, linkCount + len(nodes) - 1)
+
     def merge(self, heap2):
         """concatenates root lists of heaps"""
         if heap2 is None:
             return (0, 0)
+        self.stats.absorb(heap2.stats)  # counters of heap2 move to this heap
         compCount = 0
         linkCount = 0
         if len(self.forest) > len(heap2.forest):
@@ -136,7 +208,7 @@ class PairingSmoothHeap(PairingHeapInterface):
             self.forest = pairedForest
             # print(self.listInorder())
             # self.minNode = currentMin
-            self.updates += 1
+            self.stats.updates += 1
             # self.minNodeIndex = self.forest.index(self.minNode)
             # print("index is ", self.minNodeIndex)
             # print("forest length is ", len(self.forest))
@@ -160,20 +232,27 @@ class PairingSmoothHeap(PairingHeapInterface):
         if self.minNode.rightChild is not None:
             minNodeChildren += [self.minNode.rightChild]
             self.minNode.rightChild.parent = None
-            self.updates += 1
+            self.stats.updates += 1
             current = self.minNode.rightChild.nextSibling
             self.minNode.rightChild.nextSibling = self.minNode.rightChild
-            self.updates += 1
+            self.stats.updates += 1
+            self.minNode.rightChild.prevSibling = self.minNode.rightChild
+            self.stats.updates += 1
 
             while current != self.minNode.rightChild:
                 minNodeChildren += [current]
                 tempNode = current
                 current = current.nextSibling
                 tempNode.nextSibling = tempNode
-                self.updates += 1
+                self.stats.updates += 1
+                tempNode.prevSibling = tempNode
+                self.stats.updates += 1
                 tempNode.parent = None
-                self.updates += 1
+                self.stats.updates += 1
         self.forest = minNodeChildren
+        minKeyNode.rightChild = None  # removed node keeps no references into heap
+        minKeyNode.nextSibling = None  # nor its singleton sibling ring (not counted, heap is not affected)
+        minKeyNode.prevSibling = None
         return (minKeyNode, cc + c1, lc + l1)
 
     def treapify(self):
@@ -185,12 +264,12 @@ class PairingSmoothHeap(PairingHeapInterface):
         fs = len(self.forest)
         if len(self.forest) == 0:  # pool is empty
             self.minNode = None
-            self.updates += 1
+            self.stats.updates += 1
             return (compCount, linkCount)
 
         elif len(self.forest) == 1:
             self.minNode = self.forest[0]
-            self.updates += 1
+            self.stats.updates += 1
             return (compCount, linkCount)
 
         else:
@@ -235,7 +314,7 @@ class PairingSmoothHeap(PairingHeapInterface):
             self.forest = curr_forest
             assert len(self.forest) == 1
             self.minNode = self.forest[0]
-            self.updates += 1
+            self.stats.updates += 1
         assert (fs - 1 == linkCount)
         return (compCount, linkCount)
 
@@ -245,7 +324,7 @@ class PairingSmoothHeap(PairingHeapInterface):
         decreases key; places node in root list."""
         assert node is not None
         node.key = node.key - diff
-        self.updates += 1
+        self.stats.updates += 1
         # concatenates node to list of trees in pool
 
         if node.parent is None:  # node is a root and has children
@@ -258,27 +337,48 @@ class PairingSmoothHeap(PairingHeapInterface):
 
             if node.nextSibling == node:  # node has no siblings
                 node.parent.rightChild = None
-                self.updates += 1
+                self.stats.updates += 1
 
             else:  # node has siblings
-                current = node.nextSibling
-                while current.nextSibling != node:  # find predecessor of node
-                    current = current.nextSibling
+                current = node.prevSibling  # predecessor of node
                 current.nextSibling = node.nextSibling
-                self.updates += 1
+                self.stats.updates += 1
+                node.nextSibling.prevSibling = current
+                self.stats.updates += 1
                 if node.parent.rightChild == node:
                     node.parent.rightChild = current
-                    self.updates += 1
+                    self.stats.updates += 1
 
             node.parent = None
-            self.updates += 1
+            self.stats.updates += 1
             node.nextSibling = node
-            self.updates += 1
+            self.stats.updates += 1
+            node.prevSibling = node
+            self.stats.updates += 1
             self.forest += [node]
         return (0, 0)
 
+    def clear(self):
+        """empties heap, unlinking all nodes iteratively so that no reference cycles are left behind"""
+        stack = self.forest
+        while stack:
+            node = stack.pop()
+            if node.rightChild is not None:  # push whole sibling ring of children
+                current = node.rightChild
+                stack += [current]
+                while current.nextSibling is not node.rightChild:
+                    current = current.nextSibling
+                    stack += [current]
+            node.parent = None
+            node.rightChild = None
+            node.nextSibling = None
+            node.prevSibling = None
+            node.location = None
+        self.forest = []
+        self.minNode = None
+
     def pointer_updates(self):
-        return self.updates
+        return self.stats.updates
 
 if __name__ == "__main__":
     tree = PairingSmoothHeap()
@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+"""Consolidation strategies for the pairing heap family.
+Each strategy links a list of roots into a single tree, using link(left, right),
+which links two roots and returns the new root (ties are won by left)"""
+
+TWO_PASS = "two-pass"  # left-to-right pairing pass, then right-to-left combining pass
+MULTIPASS = "multipass"  # left-to-right pairing passes until a single tree remains
+FRONT_TO_BACK = "front-to-back"  # one pass linking every root into result, from first to last
+BACK_TO_FRONT = "back-to-front"  # one pass linking every root into result, from last to first
+AUXILIARY_TWO_PASS = "auxiliary two-pass"  # two-pass on orphaned children, multipass on roots added since (root list only)
+LAZY = "lazy"  # a single pairing pass, remaining roots stay in root list (root list only)
+
+
+def pairing_pass(roots, link):
+    """links neighbouring pairs from left to right; returns list of resulting roots"""
+    paired = []
+    for i in range(0, len(roots) - 1, 2):
+        paired += [link(roots[i], roots[i + 1])]
+    if len(roots) % 2 == 1:  # last tree if length of list is odd-numbered
+        paired += [roots[-1]]
+    return paired
+
+
+def two_pass(roots, link):
+    paired = pairing_pass(roots, link)
+    combined = paired[-1]  # start with last (rightmost) tree
+    for i in range(len(paired) - 2, -1, -1):
+        combined = link(combined, paired[i])
+    return combined
+
+
+def multipass(roots, link):
+    while len(roots) > 1:
+        roots = pairing_pass(roots, link)
+    return roots[0]
+
+
+def front_to_back(roots, link):
+    combined = roots[0]
+    for i in range(1, len(roots)):
+        combined = link(combined, roots[i])
+    return combined
+
+
+def back_to_front(roots, link):
+    combined = roots[-1]
+    for i in range(len(roots) - 2, -1, -1):
+        combined = link(combined, roots[i])
+    return combined
+
+
+CONSOLIDATE = {TWO_PASS: two_pass, MULTIPASS: multipass, FRONT_TO_BACK: front_to_back, BACK_TO_FRONT: back_to_front}
@@ -0,0 +1,127 @@
+#!/usr/bin/python3
+"""Intrusive doubly-linked list of tree roots, threaded through the
+prevRoot/nextRoot pointers of the nodes themselves"""
+
+
+class RootList:
+    """root list supporting O(1) membership test, append, prepend, removal,
+    in-place replacement and concatenation"""
+
+    def __init__(self, location=None):
+        self.first = None
+        self.last = None
+        self.length = 0
+        self.location = location  # tag stored in node.location of every member
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        """yields roots from first to last; the successor is read only after
+        the caller is done with a node, so callers may link the yielded roots"""
+        current = self.first
+        while current is not None:
+            nextRoot = current.nextRoot
+            yield current
+            current = nextRoot
+
+    def __contains__(self, node):
+        return node.location is not None and node.location == self.location
+
+    def append(self, node):
+        """adds node as last root"""
+        node.prevRoot = self.last
+        node.nextRoot = None
+        if self.last is None:
+            self.first = node
+        else:
+            self.last.nextRoot = node
+        self.last = node
+        node.location = self.location
+        self.length += 1
+
+    def prepend(self, node):
+        """adds node as first root"""
+        node.prevRoot = None
+        node.nextRoot = self.first
+        if self.first is None:
+            self.last = node
+        else:
+            self.first.prevRoot = node
+        self.first = node
+        node.location = self.location
+        self.length += 1
+
+    def remove(self, node):
+        """splices node out of the root list"""
+        if node.prevRoot is None:
+            self.first = node.nextRoot
+        else:
+            node.prevRoot.nextRoot = node.nextRoot
+        if node.nextRoot is None:
+            self.last = node.prevRoot
+        else:
+            node.nextRoot.prevRoot = node.prevRoot
+        node.prevRoot = None
+        node.nextRoot = None
+        node.location = None
+        self.length -= 1
+
+    def replace(self, node, nodes):
+        """puts the roots in nodes (in order) at the position of node,
+        which is removed from the root list"""
+        before = node.prevRoot
+        after = node.nextRoot
+        for newRoot in nodes:
+            newRoot.prevRoot = before
+            if before is None:
+                self.first = newRoot
+            else:
+                before.nextRoot = newRoot
+            newRoot.location = self.location
+            before = newRoot
+            self.length += 1
+        if before is None:
+            self.first = after
+        else:
+            before.nextRoot = after
+        if after is None:
+            self.last = before
+        else:
+            after.prevRoot = before
+        node.prevRoot = None
+        node.nextRoot = None
+        node.location = None
+        self.length -= 1
+
+    def concat(self, other):
+        """moves all roots of other behind the last root of this list
+        (retagging them if other is a root list of another location)"""
+        if other.first is None:
+            return
+        if other.location != self.location:
+            for node in other:
+                node.location = self.location
+        if self.first is None:
+            self.first = other.first
+        else:
+            self.last.nextRoot = other.first
+            other.first.prevRoot = self.last
+        self.last = other.last
+        self.length += other.length
+        other.first = None
+        other.last = None
+        other.length = 0
+
+    def clear(self):
+        """empties root list, detaching all of its roots"""
+        current = self.first
+        while current is not None:
+            nextRoot = current.nextRoot
+            current.prevRoot = None
+            current.nextRoot = None
+            current.location = None
+            current = nextRoot
+        self.first = None
+        self.last = None
+        self.length = 0
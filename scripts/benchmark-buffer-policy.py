@@ -0,0 +1,94 @@
+#!/usr/bin/python3
+"""Sweep over decrease buffer policies of smooth heap and slim heap
+as priority queue in Dijkstra's algorithm. As in paper-dijkstra-test.py, the algorithm is run
+on randomly generated Erdös-Renyi graphs of fixed size and variable edge probability.
+Reports average number of links, comparisons and pointer updates per vertex and wall time per run
+for every policy."""
+
+import os, sys, inspect
+import time
+
+# ensuring imports work
+current_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+from node import Node
+from pairing_heap import PairingHeap
+from buffer_policy import LogSizePolicy, FixedSizePolicy, FractionPolicy, DeleteMinPolicy, AdaptivePolicy
+import networkx as nx
+import random
+
+COUNT_TYPE_BOTH = 0
+COUNT_TYPE_LINKS = -1
+COUNT_TYPE_COMPS = -2
+
+TYPES = {12: "Smooth", 24: "Slim"}
+POLICIES = {"log-size": lambda: LogSizePolicy(),
+            "fixed-8": lambda: FixedSizePolicy(8),
+            "fixed-64": lambda: FixedSizePolicy(64),
+            "fraction-0.01": lambda: FractionPolicy(0.01),
+            "fraction-0.1": lambda: FractionPolicy(0.1),
+            "delete-min": lambda: DeleteMinPolicy(),
+            "adaptive": lambda: AdaptivePolicy()}
+
+NUMBER_TESTS = 5  # number of tests to run
+TEST_SIZE = 500
+EDGE_PROBABILITIES = [0.05, 0.2, 0.5, 1.0]
+WEIGHT_RANGE = 10000
+
+
+def dijkstra(graph, heapType, policy):
+    """runs Dijkstra's algorithm from vertex 0;
+    returns number of links, comparisons, pointer updates and wall time in seconds"""
+    linkCount = 0
+    compCount = 0
+    visited = [False for _ in range(len(graph.nodes()))]
+    dist = [888888888 for _ in range(len(graph.nodes()))]
+    vertex2qnode = {}  # mapping graph nodes to heap nodes
+    start = time.perf_counter()
+    heap = PairingHeap(heapType, COUNT_TYPE_BOTH, policy)
+    heap.make_heap()
+
+    dist[0] = 0  # start node
+    for v in graph.nodes():
+        qnode = Node(dist[v])
+        qnode.vertex = v
+        vertex2qnode[v] = qnode
+        (cc, lc) = heap.insert(qnode)
+        linkCount += lc
+        compCount += cc
+
+    for _ in range(len(graph.nodes())):
+        (minNode, cc, lc) = heap.delete_min()
+        linkCount += lc
+        compCount += cc
+        u = minNode.vertex
+        uk = minNode.key
+        visited[u] = True
+        for v in graph.neighbors(u):
+            alt = uk + graph.edges[u, v]['w']
+            if alt < dist[v] and not visited[v]:
+                (cc, lc) = heap.decrease_key(vertex2qnode[v], dist[v] - alt)
+                linkCount += lc
+                compCount += cc
+                dist[v] = alt
+    elapsed = time.perf_counter() - start
+    return linkCount, compCount, heap.pointer_updates(), elapsed
+
+
+if __name__ == "__main__":
+    for x in EDGE_PROBABILITIES:
+        totals = {(heapType, name): [0, 0, 0, 0] for heapType in TYPES.keys() for name in POLICIES.keys()}
+        for _ in range(NUMBER_TESTS):
+            graph = nx.fast_gnp_random_graph(TEST_SIZE, x)
+            for (u, v) in graph.edges():  # assign weights
+                graph.edges[u, v]['w'] = random.randint(1, WEIGHT_RANGE)
+            for heapType in TYPES.keys():
+                for name, makePolicy in POLICIES.items():
+                    result = dijkstra(graph, heapType, makePolicy())
+                    for i in range(4):
+                        totals[(heapType, name)][i] += result[i] / NUMBER_TESTS
+        print("p={} \t |V|={}".format(x, TEST_SIZE))
+        for (heapType, name), (links, comps, pointers, seconds) in totals.items():
+            print("[{} {}] \t avgLink: {:.2f} \t avgComp: {:.2f} \t avgPointers: {:.2f} \t time: {:.4f}s".format(
+                TYPES[heapType], name, links / TEST_SIZE, comps / TEST_SIZE, pointers / TEST_SIZE, seconds))
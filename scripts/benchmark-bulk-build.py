@@ -0,0 +1,49 @@
+#!/usr/bin/python3
+"""Benchmark of bulk loading: n calls to insert against one call to heapify (insert_many) for every variant,
+reporting best wall time of REPEATS loads, the links and comparisons of loading,
+and the links of the first delete-min, which consolidates the loaded nodes."""
+
+import os, sys, inspect
+import random
+import time
+
+# ensuring imports work
+current_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+from pairing_heap import PairingHeap, COUNT_TYPE_BOTH
+
+NUMBER_NODES = 10000
+REPEATS = 3
+
+
+def load(heapType, keys, bulk):
+    """loads keys into new heap, one by one or in one batch;
+    returns running time of loading in seconds, its (comps, links) and the links of the first delete-min"""
+    heap = PairingHeap(heapType, COUNT_TYPE_BOTH)
+    heap.make_heap()
+    start = time.perf_counter()
+    if bulk:
+        (nodes, compCount, linkCount) = heap.heapify(keys)
+    else:
+        compCount = 0
+        linkCount = 0
+        for key in keys:
+            (cc, lc) = heap.insert(heap.make_node(key))
+            compCount += cc
+            linkCount += lc
+    duration = time.perf_counter() - start
+    (minNode, cc, lc) = heap.delete_min()
+    heap.clear()
+    return duration, compCount, linkCount, lc
+
+
+if __name__ == "__main__":
+    keys = [random.randint(0, 10 ** 9) for _ in range(NUMBER_NODES)]
+    for heapType, name in PairingHeap.MODES.items():
+        single = min(load(heapType, keys, False) for _ in range(REPEATS))
+        bulk = min(load(heapType, keys, True) for _ in range(REPEATS))
+        print("[{}] \t insert: {:.1f}ms ({} comps, {} links, first delete-min {} links) \t "
+              "heapify: {:.1f}ms ({} comps, {} links, first delete-min {} links) \t speedup: {:.2f}x".format(
+               name, 1000 * single[0], single[1], single[2], single[3],
+               1000 * bulk[0], bulk[1], bulk[2], bulk[3], single[0] / bulk[0]))
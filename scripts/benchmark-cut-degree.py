@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+"""Benchmark of the cost of cutting a subtree in decrease-key for the smooth and slim heap variants.
+A single root is given a growing number of children, then a fixed number of its children
+(spread evenly over the sibling ring) is cut by decrease-key. With doubly-linked sibling rings
+the time and pointer updates per cut should not grow with the degree of the parent."""
+
+import os, sys, inspect
+import time
+
+# ensuring imports work
+current_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+from node import Node
+from pairing_slim import PairingSlimHeap
+from pairing_smooth import PairingSmoothHeap
+from slim_heap import SlimHeap
+from slim_heap_l import SlimHeapL
+from smooth_heap import SmoothHeap
+from smooth_heap_l import SmoothHeapL
+
+TYPES = {12: "Smooth", 22: "Smooth_L", 23: "Slim_L", 24: "Slim", 27: "Pairing Slim", 28: "Pairing Smooth"}
+VARIANTS = {12: SmoothHeap, 22: SmoothHeapL, 23: SlimHeapL, 24: SlimHeap, 27: PairingSlimHeap, 28: PairingSmoothHeap}
+DEGREES = [2 ** p for p in range(6, 17, 2)]
+NUMBER_CUTS = 64  # number of children cut per degree
+NUMBER_TESTS = 5  # number of repetitions, minimum time is reported
+
+
+def build_star(heapType, degree):
+    """returns heap whose only tree is a root with degree many children"""
+    root = Node(0)
+    heap = VARIANTS[heapType](root)
+    children = [Node(k) for k in range(1, degree + 1)]
+    for child in children:
+        if hasattr(heap, "link"):
+            heap.link(root, child)
+        else:
+            heap.stable_link_left(root, child)
+    if hasattr(heap, "size"):
+        heap.size = degree + 1  # buffer threshold depends on heap size
+    return heap, children
+
+
+def time_cuts(heapType, degree):
+    """returns time (in microseconds) and pointer updates per cut"""
+    bestTime = None
+    for _ in range(NUMBER_TESTS):
+        heap, children = build_star(heapType, degree)
+        step = max(1, degree // NUMBER_CUTS)
+        victims = children[step // 2::step][:NUMBER_CUTS]
+        updates = heap.pointer_updates()
+        start = time.perf_counter()
+        for child in victims:
+            heap.decrease_key(child, 1)
+        elapsed = time.perf_counter() - start
+        updates = heap.pointer_updates() - updates
+        if bestTime is None or elapsed < bestTime:
+            bestTime = elapsed
+    return 10 ** 6 * bestTime / len(victims), updates / len(victims)
+
+
+if __name__ == "__main__":
+    print("{:<16}".format("degree") + "".join("{:>12}".format(d) for d in DEGREES))
+    for heapType in TYPES.keys():
+        results = [time_cuts(heapType, degree) for degree in DEGREES]
+        print("{:<16}".format(TYPES[heapType] + " us") + "".join("{:>12.2f}".format(r[0]) for r in results))
+        print("{:<16}".format(TYPES[heapType] + " ptr") + "".join("{:>12.1f}".format(r[1]) for r in results))
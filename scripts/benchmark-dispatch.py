@@ -0,0 +1,60 @@
+#!/usr/bin/python3
+"""Benchmark of the dispatch overhead of the universal PairingHeap.
+For every variant and count type the same sequence of inserts, decrease-keys and delete-mins
+is performed once through PairingHeap and once on the underlying heap directly;
+the heap holds at most one node, so that the operations themselves are as cheap as possible,
+and the difference of both running times per operation is the cost of dispatching."""
+
+import os, sys, inspect
+import random
+import time
+
+# ensuring imports work
+current_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+from pairing_heap import PairingHeap, COUNT_TYPE_BOTH, COUNT_TYPE_LINKS, COUNT_TYPE_COMPS
+
+TYPES = {0: "Pairing_Standard", 12: "Smooth", 21: "Pairing_L", 24: "Slim", 25: "Pairing Lazy", 26: "SplayTree"}
+COUNT_TYPES = {COUNT_TYPE_BOTH: "both", COUNT_TYPE_LINKS: "links", COUNT_TYPE_COMPS: "comps"}
+NUMBER_NODES = 100000
+REPEATS = 9
+
+
+def workload(heap, keys):
+    """inserts every node into heap (either PairingHeap or underlying heap), decreases its key and deletes it again;
+    returns running time in seconds and number of operations"""
+    nodes = [heap.nodeClass(key) for key in keys]
+    insert = heap.insert
+    decrease_key = heap.decrease_key
+    delete_min = heap.delete_min
+    start = time.perf_counter()
+    for node in nodes:
+        insert(node)
+        decrease_key(node, 1)
+        delete_min()
+    return time.perf_counter() - start, 3 * len(nodes)
+
+
+def per_operation(heapType, countType, keys):
+    """returns best time per operation in nanoseconds over REPEATS runs,
+    on the underlying heap directly and through PairingHeap (runs alternate to even out noise)"""
+    best = {False: None, True: None}
+    for _ in range(REPEATS):
+        for wrapped in best.keys():
+            heap = PairingHeap(heapType, countType)
+            heap.make_heap()
+            duration, operations = workload(heap if wrapped else heap.heap, keys)
+            heap.clear()
+            if best[wrapped] is None or duration / operations < best[wrapped]:
+                best[wrapped] = duration / operations
+    return 10 ** 9 * best[False], 10 ** 9 * best[True]
+
+
+if __name__ == "__main__":
+    keys = [random.randint(10, 10 ** 9) for _ in range(NUMBER_NODES)]
+    for heapType in TYPES.keys():
+        for countType in COUNT_TYPES.keys():
+            direct, wrapped = per_operation(heapType, countType, keys)
+            print("[{}] \t count {}: \t direct: {:.0f}ns/op \t PairingHeap: {:.0f}ns/op \t dispatch: {:.0f}ns/op".format(
+                TYPES[heapType], COUNT_TYPES[countType], direct, wrapped, wrapped - direct))
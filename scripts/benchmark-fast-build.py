@@ -0,0 +1,44 @@
+#!/usr/bin/python3
+"""Benchmark of the uninstrumented build of every heap variant (PairingHeap(mode, countType=None), see fast_build.py).
+For every variant the same sequence of inserts, decrease-keys and delete-mins is timed
+with all counters (count type both) and without any; reports best wall time of REPEATS runs and speedup."""
+
+import os, sys, inspect
+import random
+import time
+
+# ensuring imports work
+current_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+from pairing_heap import PairingHeap, COUNT_TYPE_BOTH, COUNT_TYPE_NONE
+
+NUMBER_NODES = 10000
+REPEATS = 3
+
+
+def workload(heapType, countType, keys, decreases):
+    """inserts nodes with keys, decreases keys of nodes at positions in decreases and deletes all nodes;
+    returns running time in seconds"""
+    heap = PairingHeap(heapType, countType)
+    heap.make_heap()
+    nodes = [heap.make_node(key) for key in keys]
+    start = time.perf_counter()
+    for node in nodes:
+        heap.insert(node)
+    if heapType != 34:  # array-backed smooth heap decreases keys through handles only
+        for i in decreases:
+            heap.decrease_key(nodes[i], 1 + nodes[i].key // 2)
+    for _ in range(len(nodes)):
+        heap.delete_min()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    keys = [random.randint(10, 10 ** 9) for _ in range(NUMBER_NODES)]
+    decreases = random.sample(range(NUMBER_NODES), NUMBER_NODES // 2)
+    for heapType, name in PairingHeap.MODES.items():
+        counted = min(workload(heapType, COUNT_TYPE_BOTH, keys, decreases) for _ in range(REPEATS))
+        fast = min(workload(heapType, COUNT_TYPE_NONE, keys, decreases) for _ in range(REPEATS))
+        print("[{}] \t counted: {:.1f}ms \t uninstrumented: {:.1f}ms \t speedup: {:.2f}x".format(
+            name, 1000 * counted, 1000 * fast, counted / fast))
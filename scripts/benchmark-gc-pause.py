@@ -0,0 +1,66 @@
+#!/usr/bin/python3
+"""Benchmark of cyclic garbage collector pauses caused by large smooth and slim heaps.
+For every variant a heap of NUMBER_NODES nodes is built and consolidated by one delete-min, then
+- the pause of a full collection is measured with the heap alive, after building it normally
+  and after building it within gc_paused(freeze=True),
+- the heap is discarded, either as is (leaving reference cycles to the collector) or after clear(),
+  and the time of dropping it plus the following full collection is measured."""
+
+import os, sys, inspect
+import gc
+import random
+import time
+
+# ensuring imports work
+current_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+from pairing_heap import PairingHeap
+from gc_control import gc_paused
+
+TYPES = {12: "Smooth", 22: "Smooth_L", 23: "Slim_L", 24: "Slim", 27: "Pairing Slim", 28: "Pairing Smooth"}
+NUMBER_NODES = 10 ** 6
+
+
+def build(heapType):
+    """returns heap of NUMBER_NODES nodes, consolidated into trees"""
+    heap = PairingHeap(heapType)
+    heap.make_heap()
+    for _ in range(NUMBER_NODES):
+        heap.insert(heap.make_node(random.randint(0, 10 ** 9)))
+    heap.delete_min()
+    return heap
+
+
+def run(heapType, freeze, clear):
+    """builds heap (within gc_paused(freeze=True) if freeze is set) and measures the pause of a full collection,
+    then drops heap (after clearing it, if clear is set) and measures the time until its memory is freed;
+    returns both durations in milliseconds and the number of objects left to the collector"""
+    gc.collect()
+    if freeze:
+        with gc_paused(freeze=True):
+            heap = build(heapType)
+    else:
+        heap = build(heapType)
+    start = time.perf_counter()
+    gc.collect()
+    pause = 1000 * (time.perf_counter() - start)
+    if freeze:
+        gc.unfreeze()
+
+    start = time.perf_counter()
+    if clear:
+        heap.clear()
+    del heap
+    freed = gc.collect()
+    teardown = 1000 * (time.perf_counter() - start)
+    return pause, teardown, freed
+
+
+if __name__ == "__main__":
+    for heapType in TYPES.keys():
+        pause, teardown, freed = run(heapType, False, False)
+        frozenPause, teardownClear, freedClear = run(heapType, True, True)
+        print("[{}] \t gc pause: {:.1f}ms \t frozen: {:.1f}ms \t "
+              "teardown: {:.1f}ms ({} objects collected) \t with clear(): {:.1f}ms ({} objects collected)".format(
+               TYPES[heapType], pause, frozenPause, teardown, freed, teardownClear, freedClear))
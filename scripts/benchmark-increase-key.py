@@ -0,0 +1,70 @@
+#!/usr/bin/python3
+"""Benchmark of priority updates that increase keys (as in LFU demotion or deadline extension):
+every variant runs the same sequence of NUMBER_UPDATES key increases on a heap of NUMBER_NODES nodes,
+with a delete-min after every DELETE_EVERY updates, once with set_key (increase-key) and once by
+deleting the node (decrease-key to below all keys, then delete-min) and inserting a new node with the new key.
+Reports wall time, comparisons, links and pointer updates of the whole sequence."""
+
+import os, sys, inspect
+import random
+import time
+
+# ensuring imports work
+current_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+from pairing_heap import PairingHeap, COUNT_TYPE_BOTH
+
+TYPES = {0: "Pairing", 12: "Smooth", 21: "Pairing_L", 22: "Smooth_L", 23: "Slim_L", 24: "Slim", 25: "Pairing Lazy",
+         26: "SplayTree", 27: "Pairing Slim", 28: "Pairing Smooth", 34: "Smooth_Array"}
+NUMBER_NODES = 5000
+NUMBER_UPDATES = 5000
+DELETE_EVERY = 10
+MAX_KEY = 10 ** 6
+
+
+def delete_insert(heap, node, newKey):
+    """deletes node by decrease-key to -1 (below all keys) and delete-min, then inserts new node with newKey;
+    returns the new node"""
+    heap.decrease_key(node, node.key + 1)
+    heap.delete_min()
+    newNode = heap.make_node(newKey)
+    heap.insert(newNode)
+    return newNode
+
+
+def run(heapType, keys, updates, useSetKey):
+    """performs updates (pairs of node index and key increase) on heap loaded with keys;
+    returns running time in seconds and the counters accumulated by the updates and delete-mins"""
+    heap = PairingHeap(heapType, COUNT_TYPE_BOTH)
+    heap.make_heap()
+    nodes = [heap.make_node(key) for key in keys]
+    for node in nodes:
+        heap.insert(node)
+    deleted = {heap.delete_min()[0]}
+    before = heap.stats.snapshot()
+    start = time.perf_counter()
+    for (i, (index, diff)) in enumerate(updates):
+        node = nodes[index]
+        if node in deleted:
+            continue
+        if useSetKey:
+            heap.set_key(node, node.key + diff)
+        else:
+            nodes[index] = delete_insert(heap, node, node.key + diff)
+        if i % DELETE_EVERY == DELETE_EVERY - 1:
+            deleted.add(heap.delete_min()[0])
+    duration = time.perf_counter() - start
+    return duration, heap.stats - before
+
+
+if __name__ == "__main__":
+    keys = [random.randint(0, MAX_KEY) for _ in range(NUMBER_NODES)]
+    updates = [(random.randrange(NUMBER_NODES), random.randint(1, MAX_KEY // 10)) for _ in range(NUMBER_UPDATES)]
+    for heapType in TYPES.keys():
+        results = []
+        for useSetKey in (True, False):
+            (duration, stats) = run(heapType, keys, updates, useSetKey)
+            results += ["{:.3f}s, {} comps, {} links, {} pointer updates".format(
+                duration, stats.comps, stats.links, stats.updates)]
+        print("[{}] \t set_key: {} \t delete+insert: {}".format(TYPES[heapType], results[0], results[1]))
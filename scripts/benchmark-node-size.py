@@ -0,0 +1,38 @@
+#!/usr/bin/python3
+"""Memory footprint of heap nodes: bytes per node of the generic Node class
+and of the compact node type (PairingHeap.make_heap) of every heap variant,
+measured with tracemalloc over a large number of nodes."""
+
+import os, sys, inspect
+import tracemalloc
+
+# ensuring imports work
+current_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+from node import Node
+from pairing_heap import PairingHeap
+
+NUMBER_NODES = 100000
+
+
+def bytes_per_node(nodeClass):
+    """returns number of bytes allocated per node of nodeClass"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    nodes = [nodeClass(i) for i in range(NUMBER_NODES)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # subtract list of nodes and int keys beyond the small-int cache
+    overhead = sys.getsizeof(nodes) + sum(sys.getsizeof(node.key) for node in nodes if node.key > 256)
+    return (after - before - overhead) / NUMBER_NODES
+
+
+if __name__ == "__main__":
+    generic = bytes_per_node(Node)
+    for heapType, name in PairingHeap.MODES.items():
+        heap = PairingHeap(heapType)
+        nodeClass = heap.make_heap()
+        compact = bytes_per_node(nodeClass)
+        print("[{}] \t {}: {:.1f} bytes/node \t Node: {:.1f} bytes/node \t saved: {:.0%}".format(
+            name, nodeClass.__name__, compact, generic, 1 - compact / generic))
@@ -13,6 +13,7 @@ current_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentfra
 parent_dir = os.path.dirname(current_dir)
 sys.path.insert(0, parent_dir)
 from node import Node
+from node_pool import NodePool
 from pairing_heap import PairingHeap
 import networkx as nx
 import random
@@ -159,6 +160,7 @@ if __name__ == "__main__":
     minCompsPerSize = []
     minPointersPerSize = []
 
+    pools = {}  # heap nodes are recycled between runs, one pool of the compact node type per heap type
     xs = [factor * EDGE_PROBABILITY for factor in range(1, 21, 1)]
     for x in xs:
         avgCountsLinks = [0 for _ in range(MAX_TYPE_KEY + 1)]
@@ -189,12 +191,16 @@ if __name__ == "__main__":
                 prev = [None for _ in range(len(graph.nodes()))]
 
                 heap = PairingHeap(heapType, COUNT_TYPE_BOTH)
-                heap.make_heap()
+                nodeClass = heap.make_heap()
+                if heapType not in pools:
+                    pools[heapType] = NodePool(nodeClass)
+                heap.pool = pools[heapType]
+                heap.pool.reset()  # nodes of previous run are no longer in use
 
                 # Dijkstra's algorithm
                 dist[0] = 0  # start node
                 for idx, v in enumerate(graph.nodes()):
-                    qnode = Node(dist[v])
+                    qnode = heap.make_node(dist[v])
                     qnode.vertex = v
                     vertex2qnode[v] = qnode
                     (cc, lc) = heap.insert(qnode)
@@ -1,26 +1,34 @@
 #!/usr/bin/python3
-from node import Node
-import math
-from pairing_heap_interface import PairingHeapInterface
+from node import Node, SmoothNode
+from pairing_heap_interface import PairingHeapInterface, plain
+from heap_stats import HeapStats
+from buffer_policy import LogSizePolicy
 
 
 class SlimHeap(PairingHeapInterface):
     forest = []  # list storing roots of all top-level trees not in buffer
     buffer = []  # decrease buffer
+    scratch = []  # reusable scratch array for sorting buffer
+    policy = None  # decides when decrease-key flushes buffer
     minNode = None
     size = 0
-    updates = 0
+    nodeClass = SmoothNode  # compact node type sufficient for this heap
 
-    def __init__(self, root=None):
+    def __init__(self, root=None, policy=None):
+        self.stats = HeapStats()
+        self.policy = policy if policy is not None else LogSizePolicy()
         self.forest = []
         self.buffer = []
+        self.scratch = []
         if root is not None:
             root.parent = None
-            self.updates += 1
+            self.stats.updates += 1
             root.nextSibling = root
-            self.updates += 1
+            self.stats.updates += 1
+            root.prevSibling = root
+            self.stats.updates += 1
             self.minNode = root
-            self.updates += 1
+            self.stats.updates += 1
             self.forest += [root]
 
 
@@ -57,67 +65,130 @@ class SlimHeap(PairingHeapInterface):
         """child becomes leftmost child of parent"""
         if parent.rightChild is None:
             parent.rightChild = child
-            self.updates += 1
+            self.stats.updates += 1
             child.nextSibling = child
-            self.updates += 1
+            self.stats.updates += 1
+            child.prevSibling = child
+            self.stats.updates += 1
         else:
             child.nextSibling = parent.rightChild.nextSibling
-            self.updates += 1
+            self.stats.updates += 1
+            child.nextSibling.prevSibling = child
+            self.stats.updates += 1
             parent.rightChild.nextSibling = child
-            self.updates += 1
+            self.stats.updates += 1
+            child.prevSibling = parent.rightChild
+            self.stats.updates += 1
         child.parent = parent
-        self.updates += 1
+        self.stats.updates += 1
 
     def stable_link_left(self, left, right):
         """left node becomes parent of right node"""
         if left.rightChild is not None:
             right.nextSibling = left.rightChild.nextSibling
-            self.updates += 1
+            self.stats.updates += 1
+            right.nextSibling.prevSibling = right
+            self.stats.updates += 1
             left.rightChild.nextSibling = right
-            self.updates += 1
+            self.stats.updates += 1
+            right.prevSibling = left.rightChild
+            self.stats.updates += 1
         else:
             right.nextSibling = right
-            self.updates += 1
+            self.stats.updates += 1
+            right.prevSibling = right
+            self.stats.updates += 1
         left.rightChild = right
-        self.updates += 1
+        self.stats.updates += 1
         right.parent = left
-        self.updates += 1
+        self.stats.updates += 1
 
     def stable_link_right(self, left, right):
         """right node becomes parent of left node"""
         if right.rightChild is None:
             right.rightChild = left
-            self.updates += 1
+            self.stats.updates += 1
             left.nextSibling = left
-            self.updates += 1
+            self.stats.updates += 1
+            left.prevSibling = left
+            self.stats.updates += 1
         else:
             left.nextSibling = right.rightChild.nextSibling
-            self.updates += 1
+            self.stats.updates += 1
+            left.nextSibling.prevSibling = left
+            self.stats.updates += 1
             right.rightChild.nextSibling = left
-            self.updates += 1
+            self.stats.updates += 1
+            left.prevSibling = right.rightChild
+            self.stats.updates += 1
         left.parent = right
-        self.updates += 1
+        self.stats.updates += 1
 
     def insert(self, node):
         """concatenates node to list of roots in forest list"""
         if node is None:
             return (0, 0)  # no comparisons, no links
         node.nextSibling = node
-        self.updates += 1
+        self.stats.updates += 1
+        node.prevSibling = node
+        self.stats.updates += 1
         node.parent = None
-        self.updates += 1
+        self.stats.updates += 1
         self.forest += [node]
         self.size += 1
         if self.minNode is None or node.key <= self.minNode.key:
             self.minNode = node
-            self.updates += 1
+            self.stats.updates += 1
         return (1, 0)  # 1 comparison, no links
 
+    def insert_many(self, nodes):
+        """adopts list of nodes as additional roots at once (each a single-node sibling ring);
+        returns number of comparisons (one per node, for min) and links (none)"""
+        nodes = list(nodes)
+        minNode = self.minNode
+        for node in nodes:
+            node.nextSibling = node
+            node.prevSibling = node
+            node.parent = None
+            if minNode is None or node.key <= minNode.key:
+                minNode = node
+        self.stats.updates += 3 * len(nodes)
+        self.forest += nodes
+        self.size += len(nodes)
+        if minNode is not self.minNode:
+            self.minNode = minNode
+            self.stats.updates += 1
+        return (len(nodes), 0)
+
+    def roots(self):
+        return self.forest + self.buffer
+
+    def children(self, node):
+        if node.rightChild is not None:
+            child = node.rightChild.nextSibling  # leftmost child
+            while True:
+                yield child
+                if child is node.rightChild:
+                    break
+                child = child.nextSibling
+
+    def insert_sorted_run(self, nodes):
+        """links nodes given in nondecreasing order of keys into a path without comparisons
+        and inserts it as one tree; returns number of comparisons and linking ops"""
+        nodes = list(nodes)
+        if len(nodes) == 0:
+            return (0, 0)
+        for i in range(len(nodes) - 1):
+            self.link(nodes[i], nodes[i + 1])
+        (compCount, linkCount) = self.insert(nodes[0])
+        return (compCount, linkCount + len(nodes) - 1)
+
     def merge(self, heap2):
         """cleans buffer of smaller heap, then concatenates forest lists
         returns number of comparisons and link operations"""
         if heap2 is None:
             return (0, 0)
+        self.stats.absorb(heap2.stats)  # counters of heap2 move to this heap
         compCount = 0
         linkCount = 0
         if len(self.forest) + len(self.buffer) > len(heap2.forest) + len(heap2.buffer):
@@ -132,15 +203,40 @@ class SlimHeap(PairingHeapInterface):
             compCount += cc + 1  # accounting for minNode comparison (at the end) as well
             self.forest = heap2.forest + self.forest
             self.buffer = heap2.buffer
+            heap2.buffer = []  # heap2 must not share buffer with this heap
         self.size += heap2.size
-        if (self.minNode.key >= heap2.minNode.key):
+        if self.minNode is None or (heap2.minNode is not None and self.minNode.key >= heap2.minNode.key):
             self.minNode = heap2.minNode
-            self.updates += 1
+            self.stats.updates += 1
         return (compCount, linkCount)
 
+    def meld_root(self, node):
+        """merges single tree rooted at node into this heap as merge(SlimHeap(node)) would,
+        without building a temporary heap; returns number of comparisons and link operations"""
+        node.parent = None
+        self.stats.updates += 1
+        node.nextSibling = node
+        self.stats.updates += 1
+        node.prevSibling = node
+        self.stats.updates += 1
+        if len(self.forest) + len(self.buffer) > 1:
+            self.forest += [node]
+        else:
+            self.forest = [node] + self.forest
+        if self.minNode is None or self.minNode.key >= node.key:
+            self.minNode = node
+            self.stats.updates += 1
+        return (1, 0)
+
     def delete_min(self):
+        """notifies buffer policy of the delete-min, then deletes min as extract_min does.
+        Returns minNode, number of comparisons, number of link operations"""
+        self.policy.delete_min(self)
+        return self.extract_min()
+
+    def extract_min(self):
         """consolidates and empties buffer, replaces minimum by its children in root list,
-        then consolidates root list.
+        then consolidates root list; not seen by the buffer policy (as when increase-key re-inserts the min node).
         Returns minNode, number of comparisons, number of link operations"""
         (compCount, linkCount) = self.clean_buffer()
         if self.minNode is None or len(self.forest) + len(self.buffer) == 0:  # this should be the same
@@ -151,24 +247,31 @@ class SlimHeap(PairingHeapInterface):
         if self.minNode.rightChild is not None:
             minNodeChildren += [self.minNode.rightChild]
             self.minNode.rightChild.parent = None
-            self.updates += 1
+            self.stats.updates += 1
             current = self.minNode.rightChild.nextSibling
-            self.updates += 1
+            self.stats.updates += 1
             self.minNode.rightChild.nextSibling = self.minNode.rightChild
-            self.updates += 1
+            self.stats.updates += 1
+            self.minNode.rightChild.prevSibling = self.minNode.rightChild
+            self.stats.updates += 1
 
             while current != self.minNode.rightChild:
                 minNodeChildren += [current]
                 tempNode = current
                 current = current.nextSibling
                 tempNode.nextSibling = tempNode
-                self.updates += 1
+                self.stats.updates += 1
+                tempNode.prevSibling = tempNode
+                self.stats.updates += 1
                 tempNode.parent = None
-                self.updates += 1
+                self.stats.updates += 1
         idx = self.forest.index(self.minNode)
         self.forest = self.forest[:idx] + minNodeChildren + self.forest[idx + 1:]  # replace minNode with its children
         self.size -= 1
         (cc, lc) = self.treapify()
+        minKeyNode.rightChild = None  # removed node keeps no references into heap
+        minKeyNode.nextSibling = None  # nor its singleton sibling ring (not counted, heap is not affected)
+        minKeyNode.prevSibling = None
         return (minKeyNode, compCount + cc, linkCount + lc)
 
     def treapify(self):
@@ -187,198 +290,281 @@ class SlimHeap(PairingHeapInterface):
             return (compCount, linkCount)
 
         else:
-            i = 0
-            curr_forest = self.forest
-            while i < len(curr_forest) - 1:
+            # roots still waiting for their right neighbour are kept on a stack of
+            # increasing keys; each root is pushed and popped at most once
+            stack = [self.forest[0]]
+            for j in range(1, len(self.forest)):
+                successor = self.forest[j]
                 compCount += 1  # first if-else comparison
-                if curr_forest[i].key < curr_forest[i + 1].key:
-                    i = i + 1
-                else:
-                    skip = False
-                    while i > 0:
-                        compCount += 1
-                        linkCount += 1
-                        if curr_forest[i - 1].key > curr_forest[i + 1].key:
-                            # link predecessor as parent of current node
-                            self.link(curr_forest[i - 1], curr_forest[i])
-                            #self.stable_link_left(curr_forest[i - 1], curr_forest[i])
-                            # remove node at index i from top-list
-                            curr_forest = curr_forest[:i] + curr_forest[i + 1:]
-                            i = i - 1
-                        else:
-                            # link successor as parent of current node
-                            self.link(curr_forest[i + 1], curr_forest[i])
-                            #self.stable_link_right(curr_forest[i], curr_forest[i + 1])
-                            # remove node at index i from top-list
-                            curr_forest = curr_forest[:i] + curr_forest[i + 1:]
-                            # i=i+1
-                            skip = True
-                            break
-                    if not skip:  # i==0
-                        # link current as leftmost child of successor
-                        self.link(curr_forest[i + 1], curr_forest[i])
-                        #self.stable_link_right(curr_forest[i], curr_forest[i + 1])
-                        # remove node from top-list
-                        curr_forest = curr_forest[i + 1:]
-                        linkCount += 1
-
-            while i > 0:
+                if stack[-1].key < successor.key:
+                    stack.append(successor)
+                    continue
+                while len(stack) > 1:
+                    compCount += 1
+                    linkCount += 1
+                    if stack[-2].key > successor.key:
+                        # link predecessor as parent of current node
+                        self.link(stack[-2], stack[-1])
+                        stack.pop()
+                    else:
+                        # link successor as parent of current node
+                        self.link(successor, stack[-1])
+                        stack.pop()
+                        break
+                else:  # current node is bottom of stack
+                    # link current as leftmost child of successor
+                    self.link(successor, stack[-1])
+                    stack.pop()
+                    linkCount += 1
+                stack.append(successor)
+
+            while len(stack) > 1:
                 # link predecessor as parent of current node
-                self.link(curr_forest[i - 1], curr_forest[i])
-                #self.stable_link_left(curr_forest[i - 1], curr_forest[i])
-                curr_forest = curr_forest[:i]
+                self.link(stack[-2], stack[-1])
+                stack.pop()
                 linkCount += 1
-                i = i - 1
-            self.forest = curr_forest
+            self.forest = stack
             assert len(self.forest) == 1
             self.minNode = self.forest[0]
         return (compCount, linkCount)
 
-    def mergesort(self, llist):
-        # standard mergesort, implemented to count comparisons properly
-        if len(llist) < 2:
-            return 0, llist
-        split_idx = int(math.floor(len(llist) / 2))
-        compsleft, lleft = self.mergesort(llist[:split_idx])
-        compsright, lright = self.mergesort(llist[split_idx:])
-        l = 0
-        r = 0
-        comps = compsleft + compsright
-        sorted = []
-        while l + r < len(llist):
-            if r == len(lright) or (l < len(lleft) and lleft[l].key <= lright[r].key):
-                sorted += [lleft[l]]
-                l += 1
-            else:
-                sorted += [lright[r]]
-                r += 1
-            comps += 1
-        return comps, sorted
+    def mergesort_buffer(self):
+        """stable bottom-up mergesort of buffer by key, alternating between buffer and scratch array;
+        returns number of key comparisons and the list holding the sorted nodes in its first len(buffer) entries"""
+        n = len(self.buffer)
+        if len(self.scratch) < n:
+            self.scratch.extend([None] * (n - len(self.scratch)))
+        source = self.buffer
+        target = self.scratch
+        comps = 0
+        width = 1
+        while width < n:
+            for low in range(0, n, 2 * width):
+                mid = min(low + width, n)
+                high = min(low + 2 * width, n)
+                l = low
+                r = mid
+                k = low
+                while l < mid and r < high:
+                    comps += 1
+                    if source[l].key <= source[r].key:
+                        target[k] = source[l]
+                        l += 1
+                    else:
+                        target[k] = source[r]
+                        r += 1
+                    k += 1
+                while l < mid:
+                    target[k] = source[l]
+                    l += 1
+                    k += 1
+                while r < high:
+                    target[k] = source[r]
+                    r += 1
+                    k += 1
+            source, target = target, source
+            width *= 2
+        return comps, source
 
     def clean_buffer(self):
         if len(self.buffer) == 0:  # buffer is empty
             return (0, 0)
-        comps, self.buffer = self.mergesort(self.buffer)
-        self.buffer.reverse()
+        comps, ordered = self.mergesort_buffer()
         n = len(self.buffer)
 
-        while len(self.buffer) > 1:
-            self.stable_link_right(self.buffer[0], self.buffer[1])
-            self.buffer = self.buffer[1:]
-
-        treapified = self.buffer[0]
+        # chain sorted nodes into a path, largest key at the bottom
+        for i in range(n - 1, 0, -1):
+            self.stable_link_right(ordered[i], ordered[i - 1])
+        treapified = ordered[0]
+        for i in range(min(n, len(self.scratch))):
+            self.scratch[i] = None  # do not keep nodes alive through scratch array
         self.buffer = []
-        (compCount, linkCount) = self.merge(SlimHeap(treapified))
+        (compCount, linkCount) = self.meld_root(treapified)
 
         return (compCount + comps, linkCount + n - 1)  # (n-1)links while consolidating
 
-    def decrease_key(self, node, diff):
+    def cut_to_buffer(self, node, diff):
         """cut out node from current location, leaving leftmost child;
-        decrease key; place node with remaining subtree in buffer.
-        Returns number of comparisons, links"""
+        decrease key; place node with remaining subtree in buffer"""
         assert node is not None
-        linkCount = 0
-        compCount = 0
         node.key = node.key - diff
-        self.updates += 1
+        self.stats.updates += 1
+
+        if node.parent is None and node in self.buffer:
+            pass  # node is already in buffer; decreasing its key keeps heap order in its subtree
 
-        if node.parent is None and node.rightChild is None:  # node is root and has no children
+        elif node.parent is None and node not in self.forest:
+            raise Exception("node with key {} (decreased by {}) is not in heap: it has no parent and is not a root "
+                            "in forest ({} roots) or buffer ({} roots)".format(node.key, diff, len(self.forest), len(self.buffer)))
+
+        elif node.parent is None and node.rightChild is None:  # node is root and has no children
             # could just leave this in place alternatively
-            if node in self.forest:
-                idx = self.forest.index(node)
-                self.forest = self.forest[:idx] + self.forest[idx + 1:]
-                self.buffer += [node]
-            elif node in self.buffer:
-                pass
-            else:
-                self.listPreOrder()
-                raise Exception("node with key {} is not in heap".format(node.key))
+            idx = self.forest.index(node)
+            self.forest = self.forest[:idx] + self.forest[idx + 1:]
+            self.buffer += [node]
 
         elif node.parent is None:  # node is a root and has children
             leftChild = node.rightChild.nextSibling
             if leftChild.nextSibling != leftChild:
                 node.rightChild.nextSibling = leftChild.nextSibling  # cut out leftmost child
-                self.updates += 1
+                self.stats.updates += 1
+                leftChild.nextSibling.prevSibling = node.rightChild
+                self.stats.updates += 1
             else:
                 node.rightChild = None
-                self.updates += 1
+                self.stats.updates += 1
             leftChild.nextSibling = leftChild
-            self.updates += 1
+            self.stats.updates += 1
+            leftChild.prevSibling = leftChild
+            self.stats.updates += 1
             leftChild.parent = None
-            self.updates += 1
-            if node in self.forest:
-                idx = self.forest.index(node)  # remove node from pool and replace with leftChild
-                self.forest = self.forest[:idx] + [leftChild] + self.forest[idx + 1:]
-                self.buffer += [node]
-            elif node in self.buffer:
-                pass
-            else:
-                self.listPreOrder()
-                raise Exception("node with key {} is not in heap".format(node.key))
+            self.stats.updates += 1
+            idx = self.forest.index(node)  # remove node from pool and replace with leftChild
+            self.forest = self.forest[:idx] + [leftChild] + self.forest[idx + 1:]
+            self.buffer += [node]
         else:  # node is not a root
             leftChild = None
-            self.updates += 1
+            self.stats.updates += 1
             if node.rightChild is not None:
                 leftChild = node.rightChild.nextSibling
-                self.updates += 1
+                self.stats.updates += 1
                 leftChild.parent = node.parent
-                self.updates += 1
-            current = node.parent.rightChild
-            self.updates += 1
+                self.stats.updates += 1
 
             if node.nextSibling == node and leftChild is not None:  # node not a leaf and has no siblings
                 if leftChild.nextSibling != leftChild:
                     node.rightChild.nextSibling = leftChild.nextSibling  # cut out leftmost child
-                    self.updates += 1
+                    self.stats.updates += 1
+                    leftChild.nextSibling.prevSibling = node.rightChild
+                    self.stats.updates += 1
                 else:
                     node.rightChild = None
-                    self.updates += 1
+                    self.stats.updates += 1
                 leftChild.nextSibling = leftChild
-                self.updates += 1
+                self.stats.updates += 1
+                leftChild.prevSibling = leftChild
+                self.stats.updates += 1
                 node.parent.rightChild = leftChild
-                self.updates += 1
+                self.stats.updates += 1
 
             elif leftChild is not None:  # node is not a leaf and has siblings
                 if leftChild.nextSibling != leftChild:
                     node.rightChild.nextSibling = leftChild.nextSibling  # cut out leftmost child
-                    self.updates += 1
+                    self.stats.updates += 1
+                    leftChild.nextSibling.prevSibling = node.rightChild
+                    self.stats.updates += 1
                 else:
                     node.rightChild = None
-                    self.updates += 1
-                while current.nextSibling != node:  # find predecessor of node
-                    current = current.nextSibling
+                    self.stats.updates += 1
+                current = node.prevSibling  # predecessor of node
                 current.nextSibling = leftChild
-                self.updates += 1
+                self.stats.updates += 1
+                leftChild.prevSibling = current
+                self.stats.updates += 1
                 leftChild.nextSibling = node.nextSibling
-                self.updates += 1
+                self.stats.updates += 1
+                node.nextSibling.prevSibling = leftChild
+                self.stats.updates += 1
                 if node.parent.rightChild == node:
                     node.parent.rightChild = leftChild
-                    self.updates += 1
+                    self.stats.updates += 1
 
             elif node.nextSibling != node:  # node is leaf and has siblings
-                while current.nextSibling != node:
-                    current = current.nextSibling
+                current = node.prevSibling  # predecessor of node
                 current.nextSibling = node.nextSibling
-                self.updates += 1
+                self.stats.updates += 1
+                node.nextSibling.prevSibling = current
+                self.stats.updates += 1
                 if node.parent.rightChild == node:
                     node.parent.rightChild = current
-                    self.updates += 1
+                    self.stats.updates += 1
 
             else:  # node is leaf and has no siblings
                 node.parent.rightChild = None
-                self.updates += 1
+                self.stats.updates += 1
 
             node.parent = None
-            self.updates += 1
+            self.stats.updates += 1
             node.nextSibling = node
-            self.updates += 1
+            self.stats.updates += 1
+            node.prevSibling = node
+            self.stats.updates += 1
             self.buffer += [node]
 
-        if len(self.buffer) > math.ceil(math.log(self.size, 2)):
-            (cc2, lc2) = self.clean_buffer()
-            compCount += cc2
-            linkCount += lc2
+    def decrease_key(self, node, diff):
+        """decreases key of node, placing it in buffer, which is flushed as the policy decides.
+        Returns number of comparisons, links"""
+        self.cut_to_buffer(node, diff)
+        if self.policy.should_flush(self):
+            return self.clean_buffer()
+        return (0, 0)
+
+    def decrease_keys(self, nodes, diffs):
+        """decreases key of every node by the corresponding diff, placing all of them in buffer,
+        which is flushed at most once; nodes and diffs may be sequences or NumPy arrays.
+        Returns number of comparisons, links"""
+        count = 0
+        for (node, diff) in zip(plain(nodes), plain(diffs)):
+            self.cut_to_buffer(node, diff)
+            count += 1
+        if count > 0 and self.policy.should_flush(self, count):
+            return self.clean_buffer()
+        return (0, 0)
+
+    def increase_key(self, node, diff):
+        """moves children of node to root list and increases key of node, which stays in place as a leaf
+        (its parent's key is not larger); the min node is deleted and inserted again instead.
+        Returns number of comparisons, links"""
+        compCount = 0
+        linkCount = 0
+        if node is self.minNode:
+            (compCount, linkCount) = self.clean_buffer()  # min may move to a buffered node of equal key
+        if node is self.minNode:
+            (minNode, cc, lc) = self.extract_min()
+            node.key = node.key + diff
+            self.stats.updates += 1
+            (cc2, lc2) = self.insert(node)
+            return (compCount + cc + cc2, linkCount + lc + lc2)
+        children = list(self.children(node))
+        for child in children:
+            child.nextSibling = child
+            self.stats.updates += 1
+            child.prevSibling = child
+            self.stats.updates += 1
+            child.parent = None
+            self.stats.updates += 1
+            self.forest += [child]
+            compCount += 1
+            if child.key < self.minNode.key:  # children of a buffered node may be smaller than min
+                self.minNode = child
+                self.stats.updates += 1
+        if node.rightChild is not None:
+            node.rightChild = None
+            self.stats.updates += 1
+        node.key = node.key + diff
+        self.stats.updates += 1
         return (compCount, linkCount)
 
+    def clear(self):
+        """empties heap, unlinking all nodes iteratively so that no reference cycles are left behind"""
+        stack = self.forest + self.buffer
+        while stack:
+            node = stack.pop()
+            if node.rightChild is not None:  # push whole sibling ring of children
+                current = node.rightChild
+                stack += [current]
+                while current.nextSibling is not node.rightChild:
+                    current = current.nextSibling
+                    stack += [current]
+            node.parent = None
+            node.rightChild = None
+            node.nextSibling = None
+            node.prevSibling = None
+            node.location = None
+        self.forest = []
+        self.buffer = []
+        self.minNode = None
+        self.size = 0
+
     def pointer_updates(self):
-        return self.updates
\ No newline at end of file
+        return self.stats.updates
\ No newline at end of file
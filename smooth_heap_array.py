@@ -0,0 +1,688 @@
+#!/usr/bin/python3
+"""Smooth heap on struct-of-arrays storage: nodes are integer handles into preallocated
+array columns (key, parent, rightChild, nextSibling, ...), NIL marks a missing pointer.
+Follows smooth_heap.py operation by operation, with the same numbers of comparisons,
+links and pointer updates; keys have to be integers"""
+from array import array
+import copy
+import heapq
+from node import HandleNode
+from pairing_heap_interface import PairingHeapInterface, plain
+from heap_stats import HeapStats
+from buffer_policy import LogSizePolicy
+
+NIL = -1  # missing pointer
+NOWHERE = 0  # location codes, as node.location in node.py
+IN_FOREST = 1
+IN_BUFFER = 2
+POINTER_COLUMNS = ("parent", "rightChild", "nextSibling", "prevSibling", "prevRoot", "nextRoot")
+
+
+class SmoothHeapArray(PairingHeapInterface):
+    key = None  # key of every node
+    parent = None
+    rightChild = None
+    nextSibling = None
+    prevSibling = None
+    prevRoot = None  # neighbours in root list
+    nextRoot = None
+    location = None  # NOWHERE, IN_FOREST or IN_BUFFER
+    items = []  # payload object of every node, or None
+    capacity = 0  # number of preallocated nodes
+    allocated = 0  # number of handles handed out so far, including free ones
+    free = None  # handles of deleted nodes, reused by new_node
+    first = NIL  # first root in root list
+    last = NIL  # last root in root list
+    forestLength = 0
+    buffer = None  # decrease buffer
+    scratch = None  # reusable scratch array for sorting buffer
+    policy = None  # decides when decrease-key flushes buffer
+    minNode = NIL
+    size = 0
+    nodeClass = HandleNode  # payload type handed out by PairingHeap.make_heap
+
+    def __init__(self, capacity=1024, policy=None):
+        self.stats = HeapStats()
+        self.policy = policy if policy is not None else LogSizePolicy()
+        self.key = array("q")
+        for name in POINTER_COLUMNS:
+            setattr(self, name, array("q"))
+        self.location = array("b")
+        self.items = []
+        self.free = array("q")
+        self.buffer = array("q")
+        self.scratch = array("q")
+        self.grow(capacity)
+
+    def grow(self, extra):
+        """preallocates extra nodes in every column"""
+        self.key.extend(array("q", [0]) * extra)
+        for name in POINTER_COLUMNS:
+            getattr(self, name).extend(array("q", [NIL]) * extra)
+        self.location.extend(array("b", [NOWHERE]) * extra)
+        self.capacity += extra
+
+    def new_node(self, key, item=None):
+        """allocates node with given key (and payload object), reusing the handle of a deleted node if there is one;
+        returns its handle"""
+        if len(self.free) > 0:
+            handle = self.free.pop()
+            self.key[handle] = key
+            self.items[handle] = item
+            return handle
+        if self.allocated == self.capacity:
+            self.grow(max(self.capacity, 1))
+        handle = self.allocated
+        self.allocated += 1
+        self.key[handle] = key
+        self.items += [item]
+        return handle
+
+    def copy(self):
+        """returns snapshot of this heap; columns are copied as flat buffers, payload objects are shared"""
+        other = SmoothHeapArray(0)
+        other.__dict__.update(self.__dict__)
+        other.stats = self.stats.snapshot()
+        other.policy = copy.copy(self.policy)
+        other.key = self.key[:]
+        for name in POINTER_COLUMNS:
+            setattr(other, name, getattr(self, name)[:])
+        other.location = self.location[:]
+        other.items = self.items[:]
+        other.free = self.free[:]
+        other.buffer = self.buffer[:]
+        other.scratch = array("q")
+        return other
+
+    def make_heap(self):
+        # this is equivalent to init
+        pass
+
+    def find_min(self):
+        return None if self.minNode == NIL else self.items[self.minNode]
+
+    def iter_sorted(self):
+        """yields payload objects (or handles of nodes without payload) in increasing order of keys
+        without changing the heap; as PairingHeapInterface.iter_sorted on handles"""
+        frontier = []
+        current = self.first
+        while current != NIL:
+            frontier += [(self.key[current], current)]
+            current = self.nextRoot[current]
+        frontier += [(self.key[node], node) for node in self.buffer]
+        heapq.heapify(frontier)
+        while len(frontier) > 0:
+            node = heapq.heappop(frontier)[1]
+            yield node if self.items[node] is None else self.items[node]
+            last = self.rightChild[node]
+            if last != NIL:
+                child = self.nextSibling[last]  # leftmost child
+                while True:
+                    heapq.heappush(frontier, (self.key[child], child))
+                    if child == last:
+                        break
+                    child = self.nextSibling[child]
+
+    # root list, threaded through prevRoot/nextRoot as in root_list.py
+
+    def root_append(self, node):
+        self.prevRoot[node] = self.last
+        self.nextRoot[node] = NIL
+        if self.last == NIL:
+            self.first = node
+        else:
+            self.nextRoot[self.last] = node
+        self.last = node
+        self.location[node] = IN_FOREST
+        self.forestLength += 1
+
+    def root_prepend(self, node):
+        self.prevRoot[node] = NIL
+        self.nextRoot[node] = self.first
+        if self.first == NIL:
+            self.last = node
+        else:
+            self.prevRoot[self.first] = node
+        self.first = node
+        self.location[node] = IN_FOREST
+        self.forestLength += 1
+
+    def root_remove(self, node):
+        prevRoot = self.prevRoot[node]
+        nextRoot = self.nextRoot[node]
+        if prevRoot == NIL:
+            self.first = nextRoot
+        else:
+            self.nextRoot[prevRoot] = nextRoot
+        if nextRoot == NIL:
+            self.last = prevRoot
+        else:
+            self.prevRoot[nextRoot] = prevRoot
+        self.prevRoot[node] = NIL
+        self.nextRoot[node] = NIL
+        self.location[node] = NOWHERE
+        self.forestLength -= 1
+
+    def root_replace(self, node, nodes):
+        """puts the roots in nodes (in order) at the position of node, which leaves the root list"""
+        before = self.prevRoot[node]
+        after = self.nextRoot[node]
+        for newRoot in nodes:
+            self.prevRoot[newRoot] = before
+            if before == NIL:
+                self.first = newRoot
+            else:
+                self.nextRoot[before] = newRoot
+            self.location[newRoot] = IN_FOREST
+            before = newRoot
+            self.forestLength += 1
+        if before == NIL:
+            self.first = after
+        else:
+            self.nextRoot[before] = after
+        if after == NIL:
+            self.last = before
+        else:
+            self.prevRoot[after] = before
+        self.prevRoot[node] = NIL
+        self.nextRoot[node] = NIL
+        self.location[node] = NOWHERE
+        self.forestLength -= 1
+
+    def root_clear(self):
+        current = self.first
+        while current != NIL:
+            nextRoot = self.nextRoot[current]
+            self.prevRoot[current] = NIL
+            self.nextRoot[current] = NIL
+            self.location[current] = NOWHERE
+            current = nextRoot
+        self.first = NIL
+        self.last = NIL
+        self.forestLength = 0
+
+    def stable_link_left(self, left, right):
+        """left node becomes parent of right node"""
+        nextSibling = self.nextSibling
+        prevSibling = self.prevSibling
+        rightChild = self.rightChild[left]
+        if rightChild != NIL:
+            nextSibling[right] = nextSibling[rightChild]
+            prevSibling[nextSibling[right]] = right
+            nextSibling[rightChild] = right
+            prevSibling[right] = rightChild
+            self.stats.updates += 4
+        else:
+            nextSibling[right] = right
+            prevSibling[right] = right
+            self.stats.updates += 2
+        self.rightChild[left] = right
+        self.parent[right] = left
+        self.stats.updates += 2
+
+    def stable_link_right(self, left, right):
+        """right node becomes parent of left node"""
+        nextSibling = self.nextSibling
+        prevSibling = self.prevSibling
+        rightChild = self.rightChild[right]
+        if rightChild == NIL:
+            self.rightChild[right] = left
+            nextSibling[left] = left
+            prevSibling[left] = left
+            self.stats.updates += 3
+        else:
+            nextSibling[left] = nextSibling[rightChild]
+            prevSibling[nextSibling[left]] = left
+            nextSibling[rightChild] = left
+            prevSibling[left] = rightChild
+            self.stats.updates += 4
+        self.parent[left] = right
+        self.stats.updates += 1
+
+    def insert_handle(self, node):
+        """concatenates node to list of roots in forest list"""
+        self.nextSibling[node] = node
+        self.prevSibling[node] = node
+        self.parent[node] = NIL
+        self.stats.updates += 3
+        self.root_append(node)
+        self.size += 1
+        if self.minNode == NIL or self.key[node] <= self.key[self.minNode]:
+            self.minNode = node
+            self.stats.updates += 1
+        return (1, 0)  # 1 comparison, no links
+
+    def insert(self, node):
+        """allocates handle for node (stored in node.handle) and inserts it"""
+        if node is None:
+            return (0, 0)  # no comparisons, no links
+        node.handle = self.new_node(node.key, node)
+        return self.insert_handle(node.handle)
+
+    def insert_many(self, nodes):
+        """allocates handles for all nodes in one go and inserts them; returns number of comparisons and links"""
+        nodes = list(nodes)
+        if self.capacity < self.allocated + len(nodes) - len(self.free):
+            self.grow(self.allocated + len(nodes) - len(self.free) - self.capacity)
+        for node in nodes:
+            node.handle = self.new_node(node.key, node)
+            self.insert_handle(node.handle)
+        return (len(nodes), 0)  # one comparison per node, no links
+
+    def absorb(self, heap2):
+        """copies all nodes of heap2 behind the nodes of this heap; returns offset added to their handles"""
+        n = heap2.allocated
+        offset = self.allocated
+        if self.capacity < offset + n:
+            self.grow(offset + n - self.capacity)
+        self.key[offset:offset + n] = heap2.key[:n]
+        for name in POINTER_COLUMNS:
+            getattr(self, name)[offset:offset + n] = array(
+                "q", [NIL if pointer == NIL else pointer + offset for pointer in getattr(heap2, name)[:n]])
+        self.location[offset:offset + n] = heap2.location[:n]
+        self.allocated += n
+        for item in heap2.items:
+            if item is not None:
+                item.handle += offset
+        self.items += heap2.items
+        self.free.extend(array("q", [node + offset for node in heap2.free]))
+        return offset
+
+    def merge(self, heap2):
+        """cleans buffer of smaller heap, then moves nodes of heap2 into this heap
+        and concatenates root lists (heap2 must not be used afterwards);
+        returns number of comparisons and link operations"""
+        if heap2 is None:
+            return (0, 0)
+        self.stats.absorb(heap2.stats)  # counters of heap2 move to this heap
+        compCount = 1  # accounting for minNode comparison (at the end)
+        linkCount = 0
+        selfLarger = self.forestLength + len(self.buffer) > heap2.forestLength + len(heap2.buffer)
+        if selfLarger:
+            (cc, lc) = heap2.clean_buffer()
+        else:
+            (cc, lc) = self.clean_buffer()
+        linkCount += lc
+        compCount += cc
+        offset = self.absorb(heap2)
+        if heap2.first != NIL:
+            first2 = heap2.first + offset
+            last2 = heap2.last + offset
+            if self.first == NIL:
+                self.first = first2
+                self.last = last2
+            elif selfLarger:
+                self.nextRoot[self.last] = first2
+                self.prevRoot[first2] = self.last
+                self.last = last2
+            else:
+                self.nextRoot[last2] = self.first
+                self.prevRoot[self.first] = last2
+                self.first = first2
+            self.forestLength += heap2.forestLength
+        if not selfLarger:
+            self.buffer = array("q", [node + offset for node in heap2.buffer])
+        self.size += heap2.size
+        minNode2 = NIL if heap2.minNode == NIL else heap2.minNode + offset
+        if self.minNode == NIL or (minNode2 != NIL and self.key[self.minNode] >= self.key[minNode2]):
+            self.minNode = minNode2
+            self.stats.updates += 1
+        return (compCount, linkCount)
+
+    def meld_root(self, node):
+        """merges single tree rooted at node into this heap (as merge(SmoothHeap(node)) in smooth_heap.py);
+        returns number of comparisons and link operations"""
+        self.parent[node] = NIL
+        self.nextSibling[node] = node
+        self.prevSibling[node] = node
+        if self.forestLength + len(self.buffer) > 1:
+            self.root_append(node)
+        else:
+            self.root_prepend(node)
+        if self.minNode == NIL or self.key[self.minNode] >= self.key[node]:
+            self.minNode = node
+            self.stats.updates += 1
+        return (1, 0)
+
+    def delete_min_handle(self):
+        """notifies buffer policy of the delete-min, then deletes min as extract_min_handle does.
+        Returns handle of min node, number of comparisons, number of link operations"""
+        self.policy.delete_min(self)
+        return self.extract_min_handle()
+
+    def extract_min_handle(self):
+        """consolidates and empties buffer, replaces minimum by its children in root list,
+        then consolidates root list; not seen by the buffer policy (as when increase-key re-inserts the min node).
+        Returns handle of min node, number of comparisons, number of link operations"""
+        (compCount, linkCount) = self.clean_buffer()
+        if self.minNode == NIL or self.forestLength + len(self.buffer) == 0:  # this should be the same
+            return (NIL, 0, 0)
+        minKeyNode = self.minNode
+        minNodeChildren = []
+        nextSibling = self.nextSibling
+        prevSibling = self.prevSibling
+        parent = self.parent
+
+        first = self.rightChild[minKeyNode]
+        if first != NIL:
+            minNodeChildren += [first]
+            parent[first] = NIL
+            current = nextSibling[first]
+            nextSibling[first] = first
+            prevSibling[first] = first
+            self.stats.updates += 3
+
+            while current != first:
+                minNodeChildren += [current]
+                tempNode = current
+                current = nextSibling[current]
+                nextSibling[tempNode] = tempNode
+                prevSibling[tempNode] = tempNode
+                parent[tempNode] = NIL
+                self.stats.updates += 3
+        self.root_replace(minKeyNode, minNodeChildren)  # replace minNode with its children
+        self.size -= 1
+        (cc, lc) = self.treapify()
+        return (minKeyNode, compCount + cc, linkCount + lc)
+
+    def delete_min(self):
+        """returns min node (payload object), number of comparisons, number of link operations"""
+        (node, compCount, linkCount) = self.delete_min_handle()
+        if node == NIL:
+            return (None, 0, 0)
+        item = self.items[node]
+        if item is not None:
+            item.handle = NIL
+        self.release(node)  # heap does not keep deleted payload alive
+        return (item, compCount, linkCount)
+
+    def release(self, node):
+        """hands handle of node deleted from heap (e.g. by delete_min_handle) back for reuse by new_node,
+        once the caller is done with it"""
+        self.rightChild[node] = NIL  # deleted node keeps no children (not counted, heap is not affected)
+        self.items[node] = None
+        self.free.append(node)
+
+    def treapify(self):
+        """links roots in pool (forest) into treap
+        (this uses the pseudocode of delete-min from https://arxiv.org/abs/1802.05471)
+        returns number of links/comparisons
+        """
+        linkCount = 0  # counts only number of links
+        compCount = 0  # counts only number of comparisons
+        if self.forestLength == 0:  # pool is empty
+            self.minNode = NIL
+            self.stats.updates += 1
+            return (compCount, linkCount)
+
+        elif self.forestLength == 1:
+            self.minNode = self.first
+            self.stats.updates += 1
+            return (compCount, linkCount)
+
+        else:
+            key = self.key
+            nextRoot = self.nextRoot
+            # roots still waiting for their right neighbour are kept on a stack of
+            # increasing keys; each root is pushed and popped at most once
+            stack = [self.first]
+            successor = nextRoot[self.first]
+            while successor != NIL:
+                compCount += 1  # first if-else comparison
+                if key[stack[-1]] < key[successor]:
+                    stack.append(successor)
+                    successor = nextRoot[successor]
+                    continue
+                while len(stack) > 1:
+                    compCount += 1
+                    linkCount += 1
+                    if key[stack[-2]] > key[successor]:
+                        # stable-link predecessor as parent of current node
+                        self.stable_link_left(stack[-2], stack[-1])
+                        stack.pop()
+                    else:
+                        # stable-link successor as parent of current node
+                        self.stable_link_right(stack[-1], successor)
+                        stack.pop()
+                        break
+                else:  # current node is bottom of stack
+                    # stable-link current as leftmost child of successor
+                    self.stable_link_right(stack[-1], successor)
+                    stack.pop()
+                    linkCount += 1
+                stack.append(successor)
+                successor = nextRoot[successor]
+
+            while len(stack) > 1:
+                # stable-link predecessor as parent of current node
+                self.stable_link_left(stack[-2], stack[-1])
+                stack.pop()
+                linkCount += 1
+            self.root_clear()
+            self.root_append(stack[0])
+            self.minNode = stack[0]
+            self.stats.updates += 1
+        return (compCount, linkCount)
+
+    def mergesort_buffer(self):
+        """stable bottom-up mergesort of buffer by key, alternating between buffer and scratch array;
+        returns number of key comparisons and the array holding the sorted nodes in its first len(buffer) entries"""
+        n = len(self.buffer)
+        if len(self.scratch) < n:
+            self.scratch.extend(array("q", [NIL]) * (n - len(self.scratch)))
+        key = self.key
+        source = self.buffer
+        target = self.scratch
+        comps = 0
+        width = 1
+        while width < n:
+            for low in range(0, n, 2 * width):
+                mid = min(low + width, n)
+                high = min(low + 2 * width, n)
+                l = low
+                r = mid
+                k = low
+                while l < mid and r < high:
+                    comps += 1
+                    if key[source[l]] <= key[source[r]]:
+                        target[k] = source[l]
+                        l += 1
+                    else:
+                        target[k] = source[r]
+                        r += 1
+                    k += 1
+                target[k:high] = source[l:mid] if l < mid else source[r:high]
+            source, target = target, source
+            width *= 2
+        return comps, source
+
+    def clean_buffer(self):
+        if len(self.buffer) == 0:  # buffer is empty
+            return (0, 0)
+        comps, ordered = self.mergesort_buffer()
+        n = len(self.buffer)
+
+        # chain sorted nodes into a path, largest key at the bottom
+        for i in range(n - 1, 0, -1):
+            self.stable_link_right(ordered[i], ordered[i - 1])
+        treapified = ordered[0]
+        del self.buffer[:]
+        (compCount, linkCount) = self.meld_root(treapified)
+
+        return (compCount + comps, linkCount + n - 1)  # (n-1)links while consolidating
+
+    def cut_to_buffer(self, node, diff):
+        """cut out node from current location, leaving leftmost child;
+        decrease key; place node with remaining subtree in buffer"""
+        assert node != NIL
+        parent = self.parent
+        rightChild = self.rightChild
+        nextSibling = self.nextSibling
+        prevSibling = self.prevSibling
+        self.key[node] -= diff
+        self.stats.updates += 1
+
+        if parent[node] == NIL and self.location[node] == IN_BUFFER:
+            pass  # node is already in buffer; decreasing its key keeps heap order in its subtree
+
+        elif parent[node] == NIL and self.location[node] != IN_FOREST:
+            raise Exception("node with key {} is not in heap".format(self.key[node]))
+
+        elif parent[node] == NIL and rightChild[node] == NIL:  # node is root and has no children
+            self.root_remove(node)
+            self.location[node] = IN_BUFFER
+            self.buffer.append(node)
+
+        elif parent[node] == NIL:  # node is a root and has children
+            leftChild = nextSibling[rightChild[node]]
+            if nextSibling[leftChild] != leftChild:
+                nextSibling[rightChild[node]] = nextSibling[leftChild]  # cut out leftmost child
+                prevSibling[nextSibling[leftChild]] = rightChild[node]
+                self.stats.updates += 2
+            else:
+                rightChild[node] = NIL
+                self.stats.updates += 1
+            nextSibling[leftChild] = leftChild
+            prevSibling[leftChild] = leftChild
+            parent[leftChild] = NIL
+            self.stats.updates += 3
+            self.root_replace(node, [leftChild])  # remove node from pool and replace with leftChild
+            self.location[node] = IN_BUFFER
+            self.buffer.append(node)
+        else:  # node is not a root
+            leftChild = NIL
+            if rightChild[node] != NIL:
+                leftChild = nextSibling[rightChild[node]]
+                parent[leftChild] = parent[node]
+                self.stats.updates += 1
+
+            if nextSibling[node] == node and leftChild != NIL:  # node not a leaf and has no siblings
+                if nextSibling[leftChild] != leftChild:
+                    nextSibling[rightChild[node]] = nextSibling[leftChild]  # cut out leftmost child
+                    prevSibling[nextSibling[leftChild]] = rightChild[node]
+                    self.stats.updates += 2
+                else:
+                    rightChild[node] = NIL
+                    self.stats.updates += 1
+                nextSibling[leftChild] = leftChild
+                prevSibling[leftChild] = leftChild
+                rightChild[parent[node]] = leftChild
+                self.stats.updates += 3
+
+            elif leftChild != NIL:  # node is not a leaf and has siblings
+                if nextSibling[leftChild] != leftChild:
+                    nextSibling[rightChild[node]] = nextSibling[leftChild]  # cut out leftmost child
+                    prevSibling[nextSibling[leftChild]] = rightChild[node]
+                    self.stats.updates += 2
+                else:
+                    rightChild[node] = NIL
+                    self.stats.updates += 1
+                current = prevSibling[node]  # predecessor of node
+                nextSibling[current] = leftChild
+                prevSibling[leftChild] = current
+                nextSibling[leftChild] = nextSibling[node]
+                prevSibling[nextSibling[node]] = leftChild
+                self.stats.updates += 4
+                if rightChild[parent[node]] == node:
+                    rightChild[parent[node]] = leftChild
+                    self.stats.updates += 1
+
+            elif nextSibling[node] != node:  # node is leaf and has siblings
+                current = prevSibling[node]  # predecessor of node
+                nextSibling[current] = nextSibling[node]
+                prevSibling[nextSibling[node]] = current
+                self.stats.updates += 2
+                if rightChild[parent[node]] == node:
+                    rightChild[parent[node]] = current
+                    self.stats.updates += 1
+
+            else:  # node is leaf and has no siblings
+                rightChild[parent[node]] = NIL
+                self.stats.updates += 1
+
+            parent[node] = NIL
+            nextSibling[node] = node
+            prevSibling[node] = node
+            self.stats.updates += 3
+            self.location[node] = IN_BUFFER
+            self.buffer.append(node)
+
+    def decrease_key_handle(self, node, diff):
+        """decreases key of node, placing it in buffer, which is flushed as the policy decides.
+        Returns number of comparisons, links"""
+        self.cut_to_buffer(node, diff)
+        if self.policy.should_flush(self):
+            return self.clean_buffer()
+        return (0, 0)
+
+    def decrease_keys_handle(self, nodes, diffs):
+        """decreases key of every node by the corresponding diff, placing all of them in buffer,
+        which is flushed at most once; nodes and diffs may be sequences or NumPy arrays.
+        Returns number of comparisons, links"""
+        count = 0
+        for (node, diff) in zip(plain(nodes), plain(diffs)):
+            self.cut_to_buffer(node, diff)
+            count += 1
+        if count > 0 and self.policy.should_flush(self, count):
+            return self.clean_buffer()
+        return (0, 0)
+
+    def decrease_key(self, node, diff):
+        """decreases key of payload object node (and of its handle)"""
+        node.key = node.key - diff
+        return self.decrease_key_handle(node.handle, diff)
+
+    def decrease_keys(self, nodes, diffs):
+        """decreases keys of payload objects (and of their handles) by the corresponding diffs, flushing buffer at most once"""
+        nodes = list(plain(nodes))
+        diffs = plain(diffs)
+        for (node, diff) in zip(nodes, diffs):
+            node.key = node.key - diff
+        return self.decrease_keys_handle([node.handle for node in nodes], diffs)
+
+    def increase_key_handle(self, node, diff):
+        """moves children of node to root list and increases key of node, which stays in place as a leaf
+        (its parent's key is not larger); the min node is deleted and inserted again instead.
+        Returns number of comparisons, links"""
+        compCount = 0
+        linkCount = 0
+        if node == self.minNode:
+            (compCount, linkCount) = self.clean_buffer()  # min may move to a buffered node of equal key
+        if node == self.minNode:
+            (minNode, cc, lc) = self.extract_min_handle()
+            self.rightChild[node] = NIL  # removed node keeps no children, as in smooth_heap.py (not counted)
+            self.key[node] += diff
+            self.stats.updates += 1
+            (cc2, lc2) = self.insert_handle(node)
+            return (compCount + cc + cc2, linkCount + lc + lc2)
+        nextSibling = self.nextSibling
+        last = self.rightChild[node]
+        if last != NIL:
+            child = nextSibling[last]  # leftmost child
+            while True:
+                following = nextSibling[child]
+                nextSibling[child] = child
+                self.prevSibling[child] = child
+                self.parent[child] = NIL
+                self.stats.updates += 3
+                self.root_append(child)
+                compCount += 1
+                if self.key[child] < self.key[self.minNode]:  # children of a buffered node may be smaller than min
+                    self.minNode = child
+                    self.stats.updates += 1
+                if child == last:
+                    break
+                child = following
+            self.rightChild[node] = NIL
+            self.stats.updates += 1
+        self.key[node] += diff
+        self.stats.updates += 1
+        return (compCount, linkCount)
+
+    def increase_key(self, node, diff):
+        """increases key of payload object node (and of its handle)"""
+        node.key = node.key + diff
+        return self.increase_key_handle(node.handle, diff)
+
+    def pointer_updates(self):
+        return self.stats.updates
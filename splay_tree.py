@@ -1,18 +1,21 @@
-import random
-
-from node import Node
+import heapq
+from node import Node, SplayNode
 from pairing_heap_interface import PairingHeapInterface
-import numpy as np
-import sys
-sys.setrecursionlimit(100000)
+from heap_stats import HeapStats
 
 class SplayTree(PairingHeapInterface):
-    updates = 0
+    """splay tree used as priority queue: new nodes become leftmost node,
+    every node stores the minimum key of its subtree in node.min"""
+    nodeClass = SplayNode  # compact node type sufficient for this heap
+    exactMin = True  # minNode is kept up to date by every operation
     links = 0
     comps = 0
 
     def __init__(self):
+        self.stats = HeapStats()
         self.root = None
+        self.leftmost = None  # insertion point of next node
+        self.minNode = None  # node holding minimum key
 
 
     # rotate left at node x
@@ -20,37 +23,37 @@ class SplayTree(PairingHeapInterface):
         # print("rotate left")
         y = x.rightChild
         x.rightChild = y.leftChild
-        self.updates += 1
+        self.stats.updates += 1
         if y.leftChild is not None:
             y.leftChild.parent = x
-            self.updates += 1
+            self.stats.updates += 1
         y.parent = x.parent
-        self.updates += 1
+        self.stats.updates += 1
         if x.parent is None:
             self.root = y
         elif x == x.parent.leftChild:
             x.parent.leftChild = y
         else:
             x.parent.rightChild = y
-        self.updates += 1
+        self.stats.updates += 1
         y.leftChild = x
-        self.updates += 1
+        self.stats.updates += 1
         x.parent = y
-        self.updates += 1
+        self.stats.updates += 1
 
         x.min = x.key
         if x.leftChild is not None:
             x.min = min(x.min, x.leftChild.min)
         if x.rightChild is not None:
             x.min = min(x.min, x.rightChild.min)
-        self.updates += 1
+        self.stats.updates += 1
 
         y.min = y.key
         if y.leftChild is not None:
             y.min = min(y.min, y.leftChild.min)
         if y.rightChild is not None:
             y.min = min(y.min, y.rightChild.min)
-        self.updates += 1
+        self.stats.updates += 1
 
         self.comps += 4
 
@@ -59,23 +62,23 @@ class SplayTree(PairingHeapInterface):
         # print("rotate right")
         y = x.leftChild
         x.leftChild = y.rightChild
-        self.updates += 1
+        self.stats.updates += 1
         if y.rightChild is not None:
             y.rightChild.parent = x
-            self.updates += 1
+            self.stats.updates += 1
         y.parent = x.parent
-        self.updates += 1
+        self.stats.updates += 1
         if x.parent is None:
             self.root = y
         elif x == x.parent.rightChild:
             x.parent.rightChild = y
         else:
             x.parent.leftChild = y
-        self.updates += 1
+        self.stats.updates += 1
         y.rightChild = x
-        self.updates += 1
+        self.stats.updates += 1
         x.parent = y
-        self.updates += 1
+        self.stats.updates += 1
 
         x.min = x.key
         if x.leftChild is not None:
@@ -116,150 +119,243 @@ class SplayTree(PairingHeapInterface):
                 # zag-zig rotation
                 self.right_rotate(x.parent)
                 self.left_rotate(x.parent)
-            else:
-                print("broke")
-                return None
 
     def left(self, x):
         if x is None:
             return x
-        if x.leftChild is None:
-            return x
-        return self.left(x.leftChild)
+        while x.leftChild is not None:
+            x = x.leftChild
+        return x
 
     def right(self, x):
         if x is None:
             return x
-        if x.rightChild is None:
-            return x
-        return self.right(x.rightChild)
+        while x.rightChild is not None:
+            x = x.rightChild
+        return x
 
     # new leftmost node and splay to the root
     def insert(self, x):
-        leftmost = self.left(self.root)
-        if leftmost is None:
-            self.root = x
-            self.updates += 1
-            return
-        leftmost.leftChild = x
-        self.updates += 1
-        x.parent = leftmost
+        """returns number of comparisons and links performed"""
+        comps = self.comps
         x.leftChild = None
         x.rightChild = None
         x.min = x.key
-        self.updates += 3
+        if self.minNode is None or x.key < self.minNode.key:
+            self.minNode = x
+        if self.leftmost is None:
+            x.parent = None
+            self.root = x
+            self.leftmost = x
+            self.stats.updates += 1
+            return (0, 0)
+        self.leftmost.leftChild = x
+        self.stats.updates += 1
+        x.parent = self.leftmost
+        self.stats.updates += 3
         self.links += 1
+        self.leftmost = x
         self.splay(x)
+        return (self.comps - comps, 1)
+
+    def insert_many(self, nodes):
+        """links nodes into a balanced tree with the inorder sequence sequential inserts would produce
+        (last node leftmost) and joins it left of this tree; returns number of comparisons and links performed"""
+        comps = self.comps
+        links = self.links
+        ordered = list(nodes)
+        if len(ordered) == 0:
+            return (0, 0)
+        for x in ordered:
+            if self.minNode is None or x.key < self.minNode.key:
+                self.minNode = x
+        ordered.reverse()
+        top = self.build(ordered, 0, len(ordered))
+        top.parent = None
+        self.stats.updates += 1
+        if self.root is None:
+            self.root = top
+        else:
+            self.splay(self.leftmost)  # leftmost node becomes root, without left child
+            self.root.leftChild = top
+            top.parent = self.root
+            self.root.min = min(self.root.min, top.min)
+            self.stats.updates += 3
+            self.comps += 1
+            self.links += 1
+        self.leftmost = ordered[0]
+        return (self.comps - comps, self.links - links)
 
-    def find_min_node(self, x):
+    def build(self, ordered, start, end):
+        """links ordered[start:end] into a balanced tree with this inorder sequence; returns its root"""
+        middle = (start + end) // 2
+        x = ordered[middle]
+        x.leftChild = self.build(ordered, start, middle) if start < middle else None
+        x.rightChild = self.build(ordered, middle + 1, end) if middle + 1 < end else None
+        x.min = x.key
+        self.stats.updates += 3
+        for child in (x.leftChild, x.rightChild):
+            if child is not None:
+                child.parent = x
+                x.min = min(x.min, child.min)
+                self.stats.updates += 2
+                self.comps += 1
+                self.links += 1
+        return x
+
+    def iter_sorted(self):
+        """yields nodes in increasing order of keys without changing the tree (which must not change while iterating);
+        the frontier holds subtrees, by their minimum key node.min, and single nodes: a subtree is split into
+        its root node and its two subtrees, so each node yielded costs O(depth log k) for k nodes yielded"""
+        frontier = [] if self.root is None else [(self.root.min, 0, True, self.root)]
+        count = 1  # tie breaker, nodes themselves are not compared
+        while len(frontier) > 0:
+            (key, _, subtree, x) = heapq.heappop(frontier)
+            if not subtree:
+                yield x
+                continue
+            heapq.heappush(frontier, (x.key, count, False, x))
+            count += 1
+            for child in (x.leftChild, x.rightChild):
+                if child is not None:
+                    heapq.heappush(frontier, (child.min, count, True, child))
+                    count += 1
+
+    def find_min_node(self):
+        """descends along subtree minima from root to a node holding the minimum key (reads only, no pointer updates)"""
         x = self.root
-        assert self.root is not None
         while x.key != self.root.min:
-            if x.leftChild is None and x.rightChild is None:
-                print("buugggg")
-            elif x.leftChild is None:
-                x = x.rightChild
-            elif x.rightChild is None:
+            if x.leftChild is not None and x.leftChild.min == self.root.min:
                 x = x.leftChild
             else:
-                if x.leftChild.min == self.root.min:
-                    x = x.leftChild
-                elif x.rightChild.min == self.root.min:
-                    x = x.rightChild
-                else:
-                    print("bug3000")
-            self.updates += 1
-
+                x = x.rightChild
         return x
 
-    def listInorderTree(self, root):
-        if root is None:
-            return []
-        else:
-            return self.listInorderTree(root.leftChild) + [root.key] + self.listInorderTree(root.nextSibling)
+    def listInorder(self):
+        keys = []
+        stack = []
+        x = self.root
+        while stack or x is not None:
+            if x is not None:
+                stack += [x]
+                x = x.leftChild
+            else:
+                x = stack.pop()
+                keys += [x.key]
+                x = x.rightChild
+        return keys
 
     def find_min(self):
-        print(self.listInorderTree(self.root))
-        x = self.find_min_node(self.root)
-        if x.key != self.root.min:
-            print("nope")
-        print(x.key)
-        return x
+        return self.minNode
+
+    def replace(self, x, y):
+        """puts node y (already cut out of tree) at position of node x"""
+        y.leftChild = x.leftChild
+        y.rightChild = x.rightChild
+        y.parent = x.parent
+        self.stats.updates += 3
+        if y.leftChild is not None:
+            y.leftChild.parent = y
+            self.stats.updates += 1
+        if y.rightChild is not None:
+            y.rightChild.parent = y
+            self.stats.updates += 1
+        if x.parent is None:
+            self.root = y
+        elif x == x.parent.leftChild:
+            x.parent.leftChild = y
+        else:
+            x.parent.rightChild = y
+        self.stats.updates += 1
 
     def delete(self, x):
+        """removes node x from tree; a node with two children is replaced by its predecessor"""
+        predecessor = None
         if x.leftChild is not None and x.rightChild is not None:
             # rightmost in left subtree
             predecessor = self.right(x.leftChild)
-            x.key, predecessor.key = predecessor.key, x.key
-            x = predecessor
-            self.updates += 1
-
-        if x.parent is not None:
-            parent = x.parent
+            y = predecessor
         else:
-            parent = None
+            y = x
 
+        # cut out y, which has at most one child
+        parent = y.parent
         # leaf, delete it
-        if x.leftChild is None and x.rightChild is None:
-            if x.parent is not None:
-                if x.parent.leftChild == x:
-                    x.parent.leftChild = None
+        if y.leftChild is None and y.rightChild is None:
+            if y.parent is not None:
+                if y.parent.leftChild == y:
+                    y.parent.leftChild = None
                 else:
-                    x.parent.rightChild = None
-                self.updates += 1
+                    y.parent.rightChild = None
+                self.stats.updates += 1
+            else:  # last node of tree
+                self.root = None
         # one child
-        elif x.leftChild is not None:
-            if x.parent is not None:
-                if  x == x.parent.leftChild: # TODO check
-                    x.parent.leftChild = x.leftChild
-                    x.leftChild.parent = x.parent
+        elif y.leftChild is not None:
+            if y.parent is not None:
+                if y == y.parent.leftChild:
+                    y.parent.leftChild = y.leftChild
+                    y.leftChild.parent = y.parent
                 else:
-                    x.parent.rightChild = x.leftChild
-                    x.leftChild.parent = x.parent
+                    y.parent.rightChild = y.leftChild
+                    y.leftChild.parent = y.parent
             else:
-                self.root = x.leftChild
-                x.leftChild.parent = None
-        elif x.rightChild is not None:
-            if x.parent is not None:
-                if  x == x.parent.leftChild:
-                    x.parent.leftChild = x.rightChild
-                    x.rightChild.parent = x.parent
+                self.root = y.leftChild
+                y.leftChild.parent = None
+        elif y.rightChild is not None:
+            if y.parent is not None:
+                if y == y.parent.leftChild:
+                    y.parent.leftChild = y.rightChild
+                    y.rightChild.parent = y.parent
                 else:
-                    x.parent.rightChild = x.rightChild
-                    x.rightChild.parent = x.parent
+                    y.parent.rightChild = y.rightChild
+                    y.rightChild.parent = y.parent
             else:
-                self.root = x.rightChild
-                x.rightChild.parent = None
-        else:
-            print("NO")
-        self.updates += 2
+                self.root = y.rightChild
+                y.rightChild.parent = None
+        self.stats.updates += 2
+
+        if predecessor is not None:
+            self.replace(x, predecessor)
+            if parent == x:
+                parent = predecessor
 
-        if parent is None:
+        if self.root is None:
+            pass
+        elif parent is None:
             if self.root.leftChild is not None:
                 self.root.min = min(self.root.min, self.root.leftChild.min)
             if self.root.rightChild is not None:
                 self.root.min = min(self.root.min, self.root.rightChild.min)
-            self.updates += 1
+            self.stats.updates += 1
         else:
             parent.min = parent.key
             if parent.leftChild is not None:
                 parent.min = min(parent.min, parent.leftChild.min)
             if parent.rightChild is not None:
                 parent.min = min(parent.min, parent.rightChild.min)
-            self.updates += 2
-            if self.root is None:
-                print("CRY before splay")
+            self.stats.updates += 2
             self.splay(parent)
-            if self.root is None:
-                print("cry after splay")
-        if self.root is None:
-            print("cry")
+            # note new min updates in rotations during splay
 
+        x.parent = None
+        x.leftChild = None
+        x.rightChild = None
+        if x == self.leftmost:
+            self.leftmost = self.left(self.root)
+        if self.root is None:
+            self.minNode = None
+        elif x == self.minNode:
+            self.minNode = self.find_min_node()
         return x
-        # note new min updates in rotations during splay
 
     def delete_min(self):
-        return (self.delete(self.find_min()), self.comps, self.links)
+        """returns min node and number of comparisons and links performed (None, 0, 0 if tree is empty)"""
+        if self.root is None:
+            return (None, 0, 0)
+        comps = self.comps
+        links = self.links
+        return (self.delete(self.find_min()), self.comps - comps, self.links - links)
 
     # def in_order(self, node):
     #     if node is not None:
@@ -269,8 +365,73 @@ class SplayTree(PairingHeapInterface):
     #         if node.rightChild is not None:
     #             self.in_order(node.rightChild)
 
+    def decrease_key(self, node, diff):
+        """splays node to root and decreases its key there, where only the min of the root is affected;
+        returns number of comparisons and links performed"""
+        comps = self.comps
+        if node is None or diff <= 0:
+            return (0, 0)
+        self.splay(node)
+        node.key = node.key - diff
+        self.stats.updates += 1
+        self.comps += 1
+        if node.key < node.min:
+            node.min = node.key
+            self.stats.updates += 1
+        if node.key < self.minNode.key:
+            self.minNode = node
+        return (self.comps - comps, 0)
+
+    def increase_key(self, node, diff):
+        """splays node to root and increases its key there, recomputing the min of the root from its children;
+        returns number of comparisons and links performed"""
+        comps = self.comps
+        self.splay(node)
+        node.key = node.key + diff
+        node.min = node.key
+        self.stats.updates += 2
+        for child in (node.leftChild, node.rightChild):
+            if child is not None:
+                node.min = min(node.min, child.min)
+                self.comps += 1
+        if node is self.minNode:
+            self.minNode = self.find_min_node()
+        return (self.comps - comps, 0)
+
+    def merge(self, heap2):
+        """joins tree of heap2 behind this tree: splays rightmost node of this tree to root
+        and makes root of heap2 its right child; returns number of comparisons and links performed"""
+        self.stats.absorb(heap2.stats)  # counters of heap2 move to this heap
+        comps = self.comps
+        links = self.links
+        if heap2.root is None:
+            return (0, 0)
+        if self.root is None:
+            self.root = heap2.root
+            self.leftmost = heap2.leftmost
+            self.minNode = heap2.minNode
+            self.stats.updates += 1
+        else:
+            rightmost = self.right(self.root)
+            self.splay(rightmost)
+            rightmost.rightChild = heap2.root
+            self.stats.updates += 1
+            heap2.root.parent = rightmost
+            self.stats.updates += 1
+            rightmost.min = min(rightmost.min, heap2.root.min)
+            self.stats.updates += 1
+            self.comps += 1
+            self.links += 1
+            if heap2.minNode.key < self.minNode.key:
+                self.minNode = heap2.minNode
+            self.comps += 1
+        heap2.root = None
+        heap2.leftmost = None
+        heap2.minNode = None
+        return (self.comps - comps, self.links - links)
+
     def pointer_updates(self):
-        return self.updates
+        return self.stats.updates
 
 # if __name__ == "__main__":
 #     tree = SplayTree()